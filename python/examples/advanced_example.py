@@ -13,14 +13,16 @@ import asyncio
 import json
 
 from akash_api import (
-    AkashClient, AkashClientError,
     get_available_features, install_instructions,
-    ASYNC_AVAILABLE, GRPC_AVAILABLE, TRANSACTION_AVAILABLE
+    ASYNC_AVAILABLE, GRPC_AVAILABLE, TRANSACTION_AVAILABLE, FAST_JSON_AVAILABLE
 )
 
 # Conditionally import advanced features
 if ASYNC_AVAILABLE:
-    from akash_api import AkashAsyncClient, create_async_client
+    from akash_api import (
+        AkashAsyncClient, AkashAsyncClientError, create_async_client,
+        get_shared_async_client, close_shared_async_client, run_async
+    )
 
 if GRPC_AVAILABLE:
     from akash_api import AkashGrpcClient, SyncGrpcWrapper
@@ -29,44 +31,42 @@ if TRANSACTION_AVAILABLE:
     from akash_api import create_wallet_from_private_key, AkashTransactionSigner
 
 
-def basic_rest_example():
-    """Example using the basic REST client."""
+async def basic_rest_example():
+    """Example using the REST API with concurrent queries."""
     print("=== Basic REST Client Example ===")
     
     try:
         # Create client
-        client = AkashClient("https://api.akash.network")
-        
-        print("✓ Client created successfully")
-        
-        # Check health
-        if client.health_check():
-            print("✓ API endpoint is healthy")
-        else:
-            print("⚠ API endpoint health check failed")
-            return
-        
-        # Query deployments
-        print("\n📋 Querying deployments...")
-        deployments = client.get_deployments()
-        print(f"Found {len(deployments.get('deployments', []))} deployments")
-        
-        # Query providers
-        print("\n🏢 Querying providers...")
-        providers = client.get_providers()
-        print(f"Found {len(providers.get('providers', []))} providers")
-        
-        # Query market data
-        print("\n💰 Querying market data...")
-        bids = client.get_bids()
-        print(f"Found {len(bids.get('bids', []))} bids")
-        
-        leases = client.get_leases()
-        print(f"Found {len(leases.get('leases', []))} leases")
-        
-        print("✓ Basic REST example completed successfully")
+        async with AkashAsyncClient("https://api.akash.network") as client:
+            
+            print("✓ Client created successfully")
+            
+            # Check health
+            health = await client.health_check()
+            if health['rest']:
+                print("✓ API endpoint is healthy")
+            else:
+                print("⚠ API endpoint health check failed")
+                return
+            
+            # Query deployments, providers and market data concurrently
+            print("\n📋 Querying deployments, providers and market data...")
+            tasks = [
+                client.get_deployments(),
+                client.get_providers(),
+                client.get_bids(),
+                client.get_leases(),
+            ]
+            deployments, providers, bids, leases = await asyncio.gather(*tasks)
+            
+            print(f"Found {len(deployments.get('deployments', []))} deployments")
+            print(f"Found {len(providers.get('providers', []))} providers")
+            print(f"Found {len(bids.get('bids', []))} bids")
+            print(f"Found {len(leases.get('leases', []))} leases")
+            
+            print("✓ Basic REST example completed successfully")
         
-    except AkashClientError as e:
+    except AkashAsyncClientError as e:
         print(f"✗ Akash client error: {e}")
     except Exception as e:
         print(f"✗ Unexpected error: {e}")
@@ -81,34 +81,43 @@ async def advanced_async_example():
         return
     
     try:
-        # Create comprehensive async client
-        async with AkashAsyncClient(
+        # Get the shared client; its connection pool stays warm across calls
+        client = await get_shared_async_client(
             rest_endpoint="https://api.akash.network",
             grpc_endpoint="grpc.akash.network:9090" if GRPC_AVAILABLE else None,
             rpc_endpoint="https://rpc.akash.network" if TRANSACTION_AVAILABLE else None,
             chain_id="akashnet-2"
-        ) as client:
-            
-            print("✓ Async client created with context manager")
-            
-            # Health check
-            health = await client.health_check()
-            print(f"Health status: {health}")
-            
-            # Async REST queries
-            print("\n📋 Async REST queries...")
-            deployments = await client.get_deployments()
-            print(f"Deployments: {len(deployments.get('deployments', []))}")
-            
-            providers = await client.get_providers()
-            print(f"Providers: {len(providers.get('providers', []))}")
-            
-            print("✓ Advanced async example completed")
-            
+        )
+        
+        print("✓ Shared async client ready")
+        
+        # Health check
+        health = await client.health_check()
+        print(f"Health status: {health}")
+        
+        # Async REST queries
+        print("\n📋 Async REST queries...")
+        deployments = await client.get_deployments()
+        print(f"Deployments: {len(deployments.get('deployments', []))}")
+        
+        providers = await client.get_providers()
+        print(f"Providers: {len(providers.get('providers', []))}")
+        
+        print("✓ Advanced async example completed")
+        
     except Exception as e:
         print(f"✗ Async example error: {e}")
 
 
+async def async_examples():
+    """Run the async examples on a single event loop."""
+    try:
+        await basic_rest_example()
+        await advanced_async_example()
+    finally:
+        await close_shared_async_client()
+
+
 def feature_detection_example():
     """Example showing feature detection and graceful degradation."""
     print("\n=== Feature Detection Example ===")
@@ -121,11 +130,12 @@ def feature_detection_example():
         print(f"  {status} {feature}")
     
     # Show installation instructions for missing features
-    missing = install_instructions()
+    info = install_instructions()
+    missing = [feature for feature in info["extras"] if not features[feature]]
     if missing:
         print("\nTo enable missing features:")
-        for feature, command in missing.items():
-            print(f"  {feature}: {command}")
+        for feature in missing:
+            print(f"  {feature}: {info['optional'][info['extras'][feature]]}")
     else:
         print("\n✓ All features are available!")
     
@@ -134,6 +144,7 @@ def feature_detection_example():
     print(f"  ASYNC_AVAILABLE: {ASYNC_AVAILABLE}")
     print(f"  GRPC_AVAILABLE: {GRPC_AVAILABLE}")
     print(f"  TRANSACTION_AVAILABLE: {TRANSACTION_AVAILABLE}")
+    print(f"  FAST_JSON_AVAILABLE: {FAST_JSON_AVAILABLE}")
 
 
 def main():
@@ -144,14 +155,12 @@ def main():
     # Feature detection first
     feature_detection_example()
     
-    # Basic REST example (always available)
-    basic_rest_example()
-    
-    # Advanced features (conditional)
+    # REST and advanced features (conditional)
     if ASYNC_AVAILABLE:
-        asyncio.run(advanced_async_example())
+        # Same as asyncio.run(), but on uvloop when it is installed
+        run_async(async_examples())
     else:
-        print("\n⚠ Skipping async example - aiohttp not installed")
+        print("\n⚠ Skipping async examples - aiohttp not installed")
     
     print("\n" + "=" * 50)
     print("🎉 All available examples completed!")
@@ -159,9 +168,12 @@ def main():
     # Show next steps
     print("\n📖 Next steps:")
     print("1. Install missing dependencies for full functionality:")
-    missing = install_instructions()
-    for feature, command in missing.items():
-        print(f"   {command}")
+    info = install_instructions()
+    print(f"   {info['message']}")
+    features = get_available_features()
+    for feature, extra in info["extras"].items():
+        if not features[feature]:
+            print(f"   {info['optional'][extra]}")
     print("2. Replace example endpoints with your preferred Akash servers")
     print("3. Use your own private keys for transaction signing")
     print("4. Implement proper error handling for production use")
@@ -40,22 +40,79 @@ Example usage:
 
 __version__ = "0.2.0"
 
+import importlib
+from importlib.util import find_spec
+
 # Core clients
 from akash_api.client import AkashClient, AkashClientError
 
-# Advanced clients (all included by default)
-from akash_api.async_client import AkashAsyncClient, AkashAsyncClientError, create_async_client
-from akash_api.grpc_client import AkashGrpcClient, AkashGrpcClientError, SyncGrpcWrapper, create_grpc_client
-from akash_api.transaction import (
-    AkashTransactionSigner, AkashTransactionError,
-    Wallet, TransactionInfo,
-    create_wallet_from_private_key, create_signer
+# Advanced clients (all included by default), loaded on first attribute access
+# so that `import akash_api` does not pull in aiohttp, grpcio and cryptography
+_LAZY = {
+    # Async client
+    "AkashAsyncClient": "akash_api.async_client",
+    "AkashAsyncClientError": "akash_api.async_client",
+    "TxBatch": "akash_api.async_client",
+    "create_async_client": "akash_api.async_client",
+    "get_shared_async_client": "akash_api.async_client",
+    "close_shared_async_client": "akash_api.async_client",
+    "run_async": "akash_api.async_client",
+    
+    # gRPC client
+    "AkashGrpcClient": "akash_api.grpc_client",
+    "AkashGrpcClientError": "akash_api.grpc_client",
+    "AkashGrpcTransientError": "akash_api.grpc_client",
+    "ChannelPool": "akash_api.grpc_client",
+    "SyncGrpcWrapper": "akash_api.grpc_client",
+    "create_grpc_client": "akash_api.grpc_client",
+    "get_stub": "akash_api.grpc_client",
+    "get_default_channel": "akash_api.grpc_client",
+    "close_default_channels": "akash_api.grpc_client",
+    "QueryAio": "akash_api.grpc_client",
+    
+    # Transaction support
+    "AkashTransactionSigner": "akash_api.transaction",
+    "AkashTransactionError": "akash_api.transaction",
+    "Wallet": "akash_api.transaction",
+    "TransactionInfo": "akash_api.transaction",
+    "create_wallet_from_private_key": "akash_api.transaction",
+    "create_signer": "akash_api.transaction",
+}
+
+
+def __getattr__(name):
+    """Import advanced client modules lazily (PEP 562)."""
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
+
+
+# Feature availability (detected without importing the dependencies)
+ASYNC_AVAILABLE = find_spec("aiohttp") is not None
+GRPC_AVAILABLE = find_spec("grpc") is not None
+TRANSACTION_AVAILABLE = all(
+    find_spec(name) is not None for name in ("cryptography", "ecdsa")
 )
 
-# Feature availability (all True by default)
-ASYNC_AVAILABLE = True
-GRPC_AVAILABLE = True
-TRANSACTION_AVAILABLE = True
+# orjson (performance extra) speeds up REST response decoding
+FAST_JSON_AVAILABLE = find_spec("orjson") is not None
+
+# Optional extras (see install_instructions())
+STREAMING_AVAILABLE = find_spec("ijson") is not None
+HTTP2_AVAILABLE = all(find_spec(name) is not None for name in ("httpx", "h2"))
+COMPRESSION_AVAILABLE = any(
+    find_spec(name) is not None for name in ("brotli", "brotlicffi", "zstandard")
+)
+FAST_SIGNING_AVAILABLE = find_spec("coincurve") is not None
+UVLOOP_AVAILABLE = find_spec("uvloop") is not None
 
 # Always available (all features included by default)
 __all__ = [
@@ -67,17 +124,33 @@ __all__ = [
     "ASYNC_AVAILABLE",
     "GRPC_AVAILABLE", 
     "TRANSACTION_AVAILABLE",
+    "FAST_JSON_AVAILABLE",
+    "STREAMING_AVAILABLE",
+    "HTTP2_AVAILABLE",
+    "COMPRESSION_AVAILABLE",
+    "FAST_SIGNING_AVAILABLE",
+    "UVLOOP_AVAILABLE",
     
     # Async client
     "AkashAsyncClient",
     "AkashAsyncClientError", 
+    "TxBatch",
     "create_async_client",
+    "get_shared_async_client",
+    "close_shared_async_client",
+    "run_async",
     
     # gRPC client
     "AkashGrpcClient",
     "AkashGrpcClientError",
+    "AkashGrpcTransientError",
+    "ChannelPool",
     "SyncGrpcWrapper",
     "create_grpc_client",
+    "get_stub",
+    "get_default_channel",
+    "close_default_channels",
+    "QueryAio",
     
     # Transaction support
     "AkashTransactionSigner",
@@ -89,19 +162,51 @@ __all__ = [
 ]
 
 
+# Feature and installation info, built once at import time; the helpers
+# below hand out copies so callers can change or serialize them freely
+_FEATURES = {
+    "rest_client": True,
+    "async_client": ASYNC_AVAILABLE,
+    "grpc_client": GRPC_AVAILABLE,
+    "transaction_signing": TRANSACTION_AVAILABLE,
+    "fast_json": FAST_JSON_AVAILABLE,
+    "streaming": STREAMING_AVAILABLE,
+    "http2": HTTP2_AVAILABLE,
+    "compression": COMPRESSION_AVAILABLE,
+    "fast_signing": FAST_SIGNING_AVAILABLE,
+    "uvloop": UVLOOP_AVAILABLE,
+}
+
+_INSTALL = {
+    "message": "All features are included! Install with: pip install akash-api",
+    "optional": {
+        "performance": "pip install akash-api[performance]  # Better JSON performance",
+        "streaming": "pip install akash-api[streaming]  # Incremental JSON parsing for iter_* methods",
+        "http2": "pip install akash-api[http2]  # HTTP/2 REST transport",
+        "compression": "pip install akash-api[compression]  # Brotli/zstd response decompression",
+        "signing": "pip install akash-api[signing]  # libsecp256k1-backed signing",
+        "uvloop": "pip install akash-api[uvloop]  # Faster event loop for run_async()",
+    },
+    # Extra that enables each optional feature in get_available_features()
+    "extras": {
+        "fast_json": "performance",
+        "streaming": "streaming",
+        "http2": "http2",
+        "compression": "compression",
+        "fast_signing": "signing",
+        "uvloop": "uvloop",
+    },
+}
+
+
 def get_available_features():
     """
     Get a list of available features.
     
     Returns:
-        Dict with feature availability (all True by default)
+        Dict with feature availability (all True with a default install)
     """
-    return {
-        "rest_client": True,
-        "async_client": True,
-        "grpc_client": True,
-        "transaction_signing": True,
-    }
+    return dict(_FEATURES)
 
 
 def install_instructions():
@@ -112,8 +217,6 @@ def install_instructions():
         Dict with installation info (all features included by default)
     """
     return {
-        "message": "All features are included! Install with: pip install akash-api",
-        "optional": {
-            "performance": "pip install akash-api[performance]  # Better JSON performance"
-        }
+        key: dict(value) if isinstance(value, dict) else value
+        for key, value in _INSTALL.items()
     }
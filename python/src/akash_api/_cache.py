@@ -0,0 +1,47 @@
+"""
+Small in-memory caches shared by the REST and gRPC clients.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Tuple
+
+
+_MISSING = object()
+
+
+class _TTLCache:
+    """Small LRU cache whose entries expire after a fixed time-to-live."""
+    
+    def __init__(self, ttl: float, maxsize: int = 512):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+    
+    def get(self, key: Hashable) -> Any:
+        """Return the cached value, or _MISSING if absent or expired."""
+        entry = self._data.get(key)
+        if entry is None:
+            return _MISSING
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return _MISSING
+        self._data.move_to_end(key)
+        return value
+    
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the least recently used entry when full."""
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+    
+    def clear(self) -> None:
+        """Drop every entry."""
+        self._data.clear()
+    
+    def discard_if(self, predicate: Callable[[Hashable], bool]) -> None:
+        """Drop every entry whose key matches the predicate."""
+        for key in [key for key in self._data if predicate(key)]:
+            del self._data[key]
@@ -0,0 +1,44 @@
+"""
+Shared grpcio version check for the generated *_pb2_grpc modules.
+
+Every generated module used to repeat the same version comparison on import.
+The check now runs once per interpreter for each generated version.
+"""
+
+import grpc
+
+GRPC_VERSION = grpc.__version__
+
+_checked = set()
+
+
+def ensure(generated_version: str, module_path: str) -> None:
+    """
+    Verify that the installed grpcio is not older than the generated code.
+
+    Args:
+        generated_version: grpcio version the module was generated with
+        module_path: Path of the generated module, used in the error message
+
+    Raises:
+        RuntimeError: If the installed grpcio is too old
+    """
+    if generated_version in _checked:
+        return
+
+    try:
+        from grpc._utilities import first_version_is_lower
+        version_not_supported = first_version_is_lower(GRPC_VERSION, generated_version)
+    except ImportError:
+        version_not_supported = True
+
+    if version_not_supported:
+        raise RuntimeError(
+            f'The grpc package installed is at version {GRPC_VERSION},'
+            + f' but the generated code in {module_path} depends on'
+            + f' grpcio>={generated_version}.'
+            + f' Please upgrade your grpc module to grpcio>={generated_version}'
+            + f' or downgrade your generated code using grpcio-tools<={GRPC_VERSION}.'
+        )
+
+    _checked.add(generated_version)
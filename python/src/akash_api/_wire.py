@@ -0,0 +1,131 @@
+"""
+Minimal protobuf wire-format encoding for the Cosmos transaction envelope.
+
+The generated cosmos-sdk modules are not part of this package, so the few
+messages needed to sign and broadcast a transaction (``TxBody``,
+``AuthInfo``, ``SignDoc``, ``TxRaw`` and their parts) are encoded by hand.
+Field numbers follow ``cosmos/tx/v1beta1/tx.proto``; fields holding their
+default value are omitted, as proto3 serializers do.
+"""
+
+from typing import Iterable, Tuple
+
+# cosmos.tx.signing.v1beta1.SignMode
+SIGN_MODE_DIRECT = 1
+
+SECP256K1_PUBKEY_TYPE_URL = "/cosmos.crypto.secp256k1.PubKey"
+
+
+def varint(value: int) -> bytes:
+    """Encode an unsigned integer as a base-128 varint."""
+    if value < 0x80:
+        return bytes((value,))
+    out = bytearray()
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def bytes_field(number: int, data: bytes) -> bytes:
+    """Encode a length-delimited field (bytes, string or embedded message)."""
+    if not data:
+        return b""
+    return varint(number << 3 | 2) + varint(len(data)) + data
+
+
+def string_field(number: int, text: str) -> bytes:
+    """Encode a string field."""
+    return bytes_field(number, text.encode())
+
+
+def uint64_field(number: int, value: int) -> bytes:
+    """Encode a varint field (uint64, enum)."""
+    if not value:
+        return b""
+    return varint(number << 3) + varint(value)
+
+
+def encode_any(type_url: str, value: bytes) -> bytes:
+    """Encode a google.protobuf.Any."""
+    return string_field(1, type_url) + bytes_field(2, value)
+
+
+def encode_pubkey(key: bytes) -> bytes:
+    """Encode a compressed secp256k1 public key wrapped in an Any."""
+    return encode_any(SECP256K1_PUBKEY_TYPE_URL, bytes_field(1, key))
+
+
+def encode_coin(denom: str, amount: str) -> bytes:
+    """Encode a cosmos.base.v1beta1.Coin."""
+    return string_field(1, denom) + string_field(2, amount)
+
+
+def encode_tx_body(messages: Iterable[bytes], memo: str = "", timeout_height: int = 0) -> bytes:
+    """
+    Encode a TxBody.
+
+    Args:
+        messages: Messages, each already encoded as an Any
+        memo: Transaction memo
+        timeout_height: Block height after which the tx is invalid (0 = none)
+    """
+    return (
+        b"".join(bytes_field(1, message) for message in messages)
+        + string_field(2, memo)
+        + uint64_field(3, timeout_height)
+    )
+
+
+def encode_signer_info(public_key: bytes, sequence: int, mode: int = SIGN_MODE_DIRECT) -> bytes:
+    """
+    Encode a SignerInfo with a single-signer ModeInfo.
+
+    Args:
+        public_key: Public key already encoded as an Any
+        sequence: Account sequence
+        mode: Sign mode
+    """
+    mode_info = bytes_field(1, uint64_field(1, mode))
+    return bytes_field(1, public_key) + bytes_field(2, mode_info) + uint64_field(3, sequence)
+
+
+def encode_fee(amount: Iterable[Tuple[str, str]],
+               gas_limit: int,
+               payer: str = "",
+               granter: str = "") -> bytes:
+    """Encode a Fee from (denom, amount) pairs."""
+    return (
+        b"".join(bytes_field(1, encode_coin(denom, value)) for denom, value in amount)
+        + uint64_field(2, gas_limit)
+        + string_field(3, payer)
+        + string_field(4, granter)
+    )
+
+
+def encode_auth_info(signer_infos: Iterable[bytes], fee: bytes) -> bytes:
+    """Encode an AuthInfo from encoded SignerInfos and an encoded Fee."""
+    return b"".join(bytes_field(1, info) for info in signer_infos) + bytes_field(2, fee)
+
+
+def encode_sign_doc(body_bytes: bytes,
+                    auth_info_bytes: bytes,
+                    chain_id: str,
+                    account_number: int) -> bytes:
+    """Encode the SignDoc whose sha256 is signed in SIGN_MODE_DIRECT."""
+    return (
+        bytes_field(1, body_bytes)
+        + bytes_field(2, auth_info_bytes)
+        + string_field(3, chain_id)
+        + uint64_field(4, account_number)
+    )
+
+
+def encode_tx_raw(body_bytes: bytes, auth_info_bytes: bytes, signatures: Iterable[bytes]) -> bytes:
+    """Encode the TxRaw that is broadcast to the chain."""
+    return (
+        bytes_field(1, body_bytes)
+        + bytes_field(2, auth_info_bytes)
+        + b"".join(bytes_field(3, signature) for signature in signatures)
+    )
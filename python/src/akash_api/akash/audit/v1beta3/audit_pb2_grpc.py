@@ -1,28 +1,14 @@
 # Generated by the gRPC Python protocol compiler plugin. DO NOT EDIT!
 """Client and server classes corresponding to protobuf-defined services."""
 import grpc
-import warnings
 
 from akash_api.akash.audit.v1beta3 import audit_pb2 as akash_dot_audit_dot_v1beta3_dot_audit__pb2
 
 GRPC_GENERATED_VERSION = '1.73.1'
 GRPC_VERSION = grpc.__version__
-_version_not_supported = False
 
-try:
-    from grpc._utilities import first_version_is_lower
-    _version_not_supported = first_version_is_lower(GRPC_VERSION, GRPC_GENERATED_VERSION)
-except ImportError:
-    _version_not_supported = True
-
-if _version_not_supported:
-    raise RuntimeError(
-        f'The grpc package installed is at version {GRPC_VERSION},'
-        + f' but the generated code in akash/audit/v1beta3/audit_pb2_grpc.py depends on'
-        + f' grpcio>={GRPC_GENERATED_VERSION}.'
-        + f' Please upgrade your grpc module to grpcio>={GRPC_GENERATED_VERSION}'
-        + f' or downgrade your generated code using grpcio-tools<={GRPC_VERSION}.'
-    )
+from akash_api._grpc_version import ensure as _ensure_grpc_version
+_ensure_grpc_version(GRPC_GENERATED_VERSION, 'akash/audit/v1beta3/audit_pb2_grpc.py')
 
 class MsgStub(object):
     """Msg defines the provider Msg service
@@ -6,8 +6,14 @@ capabilities with async support.
 """
 
 import asyncio
+import atexit
+import concurrent.futures
+import functools
 import logging
-from typing import Optional, Dict, Any, List, AsyncGenerator, Union
+import re
+import sys
+from collections import defaultdict
+from typing import Optional, Dict, Any, List, AsyncGenerator, Union, Tuple
 from contextlib import AsyncExitStack
 
 try:
@@ -16,14 +22,105 @@ try:
 except ImportError:
     AIOHTTP_AVAILABLE = False
 
-from .client import AkashClient, AkashClientError
-from .grpc_client import AkashGrpcClient, AkashGrpcClientError
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+from ._cache import _MISSING, _TTLCache
+from .client import AkashClient, AkashClientError, _json_loads
+from .grpc_client import AkashGrpcClient, AkashGrpcClientError, close_default_channels
 from .transaction import AkashTransactionSigner, Wallet, TransactionInfo, AkashTransactionError
 
 
 class AkashAsyncClientError(Exception):
     """Base exception for async client errors."""
-    pass
+    __slots__ = ()
+
+
+def _accept_encoding() -> str:
+    """
+    Build the Accept-Encoding header for the aiohttp session.
+    
+    Only encodings this aiohttp build can decode are advertised, strongest
+    first; Brotli and zstd depend on optional packages and the aiohttp version.
+    """
+    try:
+        from aiohttp import compression_utils
+    except ImportError:
+        compression_utils = None
+    
+    encodings = []
+    if getattr(compression_utils, "HAS_ZSTD", False):
+        encodings.append("zstd")
+    if getattr(compression_utils, "HAS_BROTLI", False):
+        encodings.append("br")
+    encodings.append("gzip")
+    return ", ".join(encodings)
+
+
+# REST query filters as ordered (key, value) pairs
+_Params = Tuple[Tuple[str, Any], ...]
+
+# ABCI code returned by the auth module for an incorrect account sequence
+_SEQUENCE_MISMATCH_CODE = 32
+
+# Read size for streamed REST bodies
+_STREAM_CHUNK_SIZE = 65536
+
+# Bech32 account address (20- or 32-byte payload); its charset has no quotes,
+# so a match is safe to embed in a Tendermint event query
+_AKASH_ADDRESS = re.compile(r"akash1[qpzry9x8gf2tvdw0s3jn54khce6mua7l]{38,58}")
+
+
+def _is_sequence_mismatch(message: str) -> bool:
+    """Check whether a broadcast error reports an incorrect account sequence."""
+    message = message.lower()
+    return "account sequence mismatch" in message or "incorrect account sequence" in message
+
+
+def _u64_from_str(value: Any) -> int:
+    """
+    Parse a uint64 field from a REST response.
+    
+    Cosmos REST encodes uint64 values as decimal strings; those take the
+    plain-digit fast path, anything else falls back to int() (missing -> 0).
+    """
+    if value.__class__ is str and value.isascii() and value.isdigit():
+        return int(value)
+    return int(value or 0)
+
+
+class _AsyncChunkReader:
+    """Expose an async byte iterator through the read() interface ijson expects."""
+    
+    __slots__ = ("_chunks",)
+    
+    def __init__(self, chunks):
+        self._chunks = chunks.__aiter__()
+    
+    async def read(self, size: int = -1) -> bytes:
+        # ijson probes the stream type with read(0); don't consume a chunk for it
+        if size == 0:
+            return b""
+        # An empty chunk would be taken as end of stream
+        async for chunk in self._chunks:
+            if chunk:
+                return chunk
+        return b""
 
 
 class AkashAsyncClient:
@@ -34,12 +131,28 @@ class AkashAsyncClient:
     async-friendly interface with proper connection management.
     """
     
+    __slots__ = (
+        "rest_endpoint", "grpc_endpoint", "rpc_endpoint", "chain_id", "timeout",
+        "http2", "coalesce_window", "prefer_grpc",
+        "_url_deployments", "_url_providers", "_url_bids", "_url_leases",
+        "_url_node_info", "_url_account_tpl",
+        "_rest_session", "_http", "_grpc_client", "_transaction_signer", "_exit_stack",
+        "_inflight", "_account_cache", "_account_locks",
+        "_signing_executor", "_owns_signing_executor", "_cache",
+    )
+    
     def __init__(self,
                  rest_endpoint: str,
                  grpc_endpoint: Optional[str] = None,
                  rpc_endpoint: Optional[str] = None,
                  chain_id: str = "akashnet-2",
-                 timeout: int = 30):
+                 timeout: int = 30,
+                 http2: bool = False,
+                 coalesce_window: float = 0.0,
+                 prefer_grpc: bool = False,
+                 signing_executor: Optional[concurrent.futures.Executor] = None,
+                 cache_ttl: float = 3.0,
+                 cache_size: int = 128):
         """
         Initialize the comprehensive async client.
         
@@ -49,37 +162,116 @@ class AkashAsyncClient:
             rpc_endpoint: Optional RPC endpoint for transactions
             chain_id: Blockchain chain ID
             timeout: Request timeout
+            http2: Use httpx with HTTP/2 multiplexing for REST calls
+            coalesce_window: Seconds a finished REST result keeps being shared
+                with identical requests (0 shares only in-flight requests)
+            prefer_grpc: Serve get_* list queries over gRPC when a gRPC
+                endpoint is configured, falling back to REST otherwise
+            signing_executor: Executor that builds and signs transactions off
+                the event loop. Pass a ProcessPoolExecutor to spread signing
+                across cores; defaults to a single worker thread owned by
+                the client
+            cache_ttl: Seconds deployment and provider listings are served from
+                memory (0 disables the cache)
+            cache_size: Maximum number of cached responses
         """
         self.rest_endpoint = rest_endpoint
         self.grpc_endpoint = grpc_endpoint
         self.rpc_endpoint = rpc_endpoint
         self.chain_id = chain_id
         self.timeout = timeout
+        self.http2 = http2
+        self.coalesce_window = coalesce_window
+        self.prefer_grpc = prefer_grpc
+        
+        # REST URLs, built once rather than on every call
+        base = rest_endpoint.rstrip('/')
+        self._url_deployments = base + "/akash/deployment/v1beta3/deployments"
+        self._url_providers = base + "/akash/provider/v1beta3/providers"
+        self._url_bids = base + "/akash/market/v1beta4/bids/list"
+        self._url_leases = base + "/akash/market/v1beta4/leases/list"
+        self._url_node_info = base + "/cosmos/base/tendermint/v1beta1/node_info"
+        self._url_account_tpl = base + "/cosmos/auth/v1beta1/accounts/{}"
         
         # Client instances (initialized lazily)
         self._rest_session = None
+        self._http = None
         self._grpc_client = None
         self._transaction_signer = None
         self._exit_stack = None
+        
+        # In-flight REST requests and recent responses, keyed by (url, params)
+        self._inflight: Dict[tuple, asyncio.Future] = {}
+        self._cache = _TTLCache(cache_ttl, cache_size) if cache_ttl > 0 else None
+        
+        # Account number/sequence per address, serialized by a per-address lock
+        self._account_cache: Dict[str, Dict[str, int]] = {}
+        self._account_locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+        
+        # Caller-provided executors are left running on exit
+        self._signing_executor = signing_executor
+        self._owns_signing_executor = False
     
     async def __aenter__(self):
         """Async context manager entry."""
         self._exit_stack = AsyncExitStack()
         
-        # Initialize HTTP session
-        if AIOHTTP_AVAILABLE:
+        # Initialize HTTP session with a keep-alive connection pool. httpx
+        # already advertises every encoding it can decode (br/zstd when the
+        # compression extra is installed)
+        if self.http2:
+            if not HTTPX_AVAILABLE:
+                raise AkashAsyncClientError(
+                    "httpx is required for HTTP/2 support. Install with: pip install akash-api[http2]"
+                )
+            self._http = await self._exit_stack.enter_async_context(
+                httpx.AsyncClient(
+                    http2=True,
+                    timeout=self.timeout,
+                    limits=httpx.Limits(max_keepalive_connections=20, max_connections=100)
+                )
+            )
+        elif AIOHTTP_AVAILABLE:
+            # aiohttp already sets TCP_NODELAY on every connection it opens
+            connector = aiohttp.TCPConnector(
+                limit=256,
+                limit_per_host=64,
+                keepalive_timeout=120,
+                ttl_dns_cache=300,
+                force_close=False
+            )
             self._rest_session = await self._exit_stack.enter_async_context(
-                aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=self.timeout))
+                aiohttp.ClientSession(
+                    connector=connector,
+                    connector_owner=True,
+                    headers={"Accept-Encoding": _accept_encoding()},
+                    timeout=aiohttp.ClientTimeout(total=self.timeout)
+                )
             )
         
         # Initialize gRPC client if endpoint provided
         if self.grpc_endpoint:
-            self._grpc_client = AkashGrpcClient(self.grpc_endpoint, timeout=self.timeout)
-            await self._exit_stack.enter_async_context(self._grpc_client)
+            try:
+                grpc_client = AkashGrpcClient(self.grpc_endpoint, timeout=self.timeout)
+            except AkashGrpcClientError as e:
+                # grpcio or the generated services are missing; get_* stay on
+                # REST and the grpc_query_* methods report the client as absent
+                logging.warning(f"gRPC disabled for {self.grpc_endpoint}: {e}")
+            else:
+                self._grpc_client = await self._exit_stack.enter_async_context(grpc_client)
         
         # Initialize transaction signer if RPC endpoint provided
         if self.rpc_endpoint:
-            self._transaction_signer = AkashTransactionSigner(self.rpc_endpoint, self.chain_id)
+            self._transaction_signer = await self._exit_stack.enter_async_context(
+                AkashTransactionSigner(self.rpc_endpoint, self.chain_id, timeout=self.timeout)
+            )
+            if self._signing_executor is None:
+                self._signing_executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="akash-signer"
+                )
+                self._owns_signing_executor = True
+            if self._owns_signing_executor:
+                self._exit_stack.callback(self._shutdown_signing_executor)
         
         return self
     
@@ -88,6 +280,11 @@ class AkashAsyncClient:
         if self._exit_stack:
             await self._exit_stack.aclose()
     
+    def _shutdown_signing_executor(self):
+        self._signing_executor.shutdown(wait=False)
+        self._signing_executor = None
+        self._owns_signing_executor = False
+    
     # REST API methods (async versions)
     async def get_deployments(self,
                              owner: Optional[str] = None,
@@ -104,117 +301,440 @@ class AkashAsyncClient:
         Returns:
             Deployment data
         """
-        if not self._rest_session:
-            raise AkashAsyncClientError("Client not properly initialized. Use async context manager.")
-        
-        params = {}
-        if owner:
-            params['owner'] = owner
-        if state:
-            params['state'] = state
-        if dseq:
-            params['dseq'] = str(dseq)
+        if self.prefer_grpc and self._grpc_client and not dseq:
+            return await self._grpc_client.query_deployments(owner=owner, state=state)
         
-        url = f"{self.rest_endpoint}/akash/deployment/v1beta3/deployments"
+        url = self._url_deployments
+        return await self._get_json(url, self._deployment_params(owner, state, dseq), cache=True)
+    
+    async def iter_deployments(self,
+                               owner: Optional[str] = None,
+                               state: Optional[str] = None,
+                               dseq: Optional[int] = None) -> AsyncGenerator[Dict[str, Any], None]:
+        """
+        Stream deployments via REST API, parsing while the body downloads.
         
-        async with self._rest_session.get(url, params=params) as response:
-            response.raise_for_status()
-            return await response.json()
+        Accepts the same filters as get_deployments but yields one deployment
+        at a time instead of materializing the whole response.
+        """
+        url = self._url_deployments
+        async for item in self._iter_json_items(
+            url, self._deployment_params(owner, state, dseq), "deployments"
+        ):
+            yield item
     
     async def get_providers(self) -> Dict[str, Any]:
         """Get providers via REST API (async)."""
-        if not self._rest_session:
-            raise AkashAsyncClientError("Client not properly initialized. Use async context manager.")
+        if self.prefer_grpc and self._grpc_client:
+            return await self._grpc_client.query_providers()
         
-        url = f"{self.rest_endpoint}/akash/provider/v1beta3/providers"
-        
-        async with self._rest_session.get(url) as response:
-            response.raise_for_status()
-            return await response.json()
+        url = self._url_providers
+        return await self._get_json(url, cache=True)
+    
+    async def iter_providers(self) -> AsyncGenerator[Dict[str, Any], None]:
+        """Stream providers via REST API (async)."""
+        url = self._url_providers
+        async for item in self._iter_json_items(url, None, "providers"):
+            yield item
     
     async def get_bids(self,
                       owner: Optional[str] = None,
                       provider: Optional[str] = None,
-                      state: Optional[str] = None) -> Dict[str, Any]:
-        """Get bids via REST API (async)."""
-        if not self._rest_session:
-            raise AkashAsyncClientError("Client not properly initialized. Use async context manager.")
-        
-        params = {}
-        if owner:
-            params['owner'] = owner
-        if provider:
-            params['provider'] = provider
-        if state:
-            params['state'] = state
+                      state: Optional[str] = None,
+                      cache: bool = False) -> Dict[str, Any]:
+        """
+        Get bids via REST API (async).
         
-        url = f"{self.rest_endpoint}/akash/market/v1beta4/bids/list"
+        Bids change quickly, so they are only served from the response
+        cache when cache=True.
+        """
+        if self.prefer_grpc and self._grpc_client:
+            return await self._grpc_client.query_bids(owner=owner, provider=provider, state=state)
         
-        async with self._rest_session.get(url, params=params) as response:
-            response.raise_for_status()
-            return await response.json()
+        url = self._url_bids
+        return await self._get_json(url, self._market_params(owner, provider, state), cache=cache)
+    
+    async def iter_bids(self,
+                        owner: Optional[str] = None,
+                        provider: Optional[str] = None,
+                        state: Optional[str] = None) -> AsyncGenerator[Dict[str, Any], None]:
+        """Stream bids via REST API (async)."""
+        url = self._url_bids
+        async for item in self._iter_json_items(
+            url, self._market_params(owner, provider, state), "bids"
+        ):
+            yield item
     
     async def get_leases(self,
                         owner: Optional[str] = None,
                         provider: Optional[str] = None,
-                        state: Optional[str] = None) -> Dict[str, Any]:
-        """Get leases via REST API (async)."""
+                        state: Optional[str] = None,
+                        cache: bool = False) -> Dict[str, Any]:
+        """
+        Get leases via REST API (async).
+        
+        Leases change quickly, so they are only served from the response
+        cache when cache=True.
+        """
+        if self.prefer_grpc and self._grpc_client:
+            return await self._grpc_client.query_leases(owner=owner, provider=provider, state=state)
+        
+        url = self._url_leases
+        return await self._get_json(url, self._market_params(owner, provider, state), cache=cache)
+    
+    async def iter_leases(self,
+                        owner: Optional[str] = None,
+                        provider: Optional[str] = None,
+                        state: Optional[str] = None) -> AsyncGenerator[Dict[str, Any], None]:
+        """Stream leases via REST API (async)."""
+        url = self._url_leases
+        async for item in self._iter_json_items(
+            url, self._market_params(owner, provider, state), "leases"
+        ):
+            yield item
+    
+    # Query filters are (key, value) tuples: the transports take them as-is
+    # and the tuple doubles as the request-sharing key
+    @staticmethod
+    def _deployment_params(owner: Optional[str],
+                           state: Optional[str],
+                           dseq: Optional[int]) -> _Params:
+        """Build deployment query filters."""
+        return tuple(
+            (key, value)
+            for key, value in (('owner', owner), ('state', state), ('dseq', dseq))
+            if value
+        )
+    
+    @staticmethod
+    def _market_params(owner: Optional[str],
+                       provider: Optional[str],
+                       state: Optional[str]) -> _Params:
+        """Build bid and lease query filters."""
+        return tuple(
+            (key, value)
+            for key, value in (('owner', owner), ('provider', provider), ('state', state))
+            if value
+        )
+    
+    async def _iter_json_items(self,
+                               url: str,
+                               params: Optional[_Params],
+                               field: str) -> AsyncGenerator[Dict[str, Any], None]:
+        """
+        Yield the elements of a top-level JSON array field as they are parsed.
+        
+        Uses ijson to decode the body incrementally when it is installed, and
+        falls back to decoding the full response otherwise.
+        """
+        if not IJSON_AVAILABLE:
+            data = await self._get_json(url, params)
+            for item in data.get(field, []):
+                yield item
+            return
+        
+        prefix = f"{field}.item"
+        
+        if self._http is not None:
+            async with self._http.stream("GET", url, params=params) as response:
+                response.raise_for_status()
+                reader = _AsyncChunkReader(response.aiter_bytes(_STREAM_CHUNK_SIZE))
+                async for item in ijson.items_async(reader, prefix, use_float=True):
+                    yield item
+            return
+        
         if not self._rest_session:
             raise AkashAsyncClientError("Client not properly initialized. Use async context manager.")
         
-        params = {}
-        if owner:
-            params['owner'] = owner
-        if provider:
-            params['provider'] = provider
-        if state:
-            params['state'] = state
+        async with self._rest_session.get(url, params=params) as response:
+            response.raise_for_status()
+            async for item in ijson.items_async(response.content, prefix, use_float=True):
+                yield item
+    
+    async def _get_json(self,
+                        url: str,
+                        params: Optional[_Params] = None,
+                        cache: bool = False) -> Dict[str, Any]:
+        """
+        Perform a REST GET, sharing the result between identical requests.
+        
+        Concurrent callers asking for the same URL and parameters await a single
+        HTTP request, and with cache=True recent responses are served from the
+        TTL cache. The decoded body is shared, so callers must not mutate it.
+        """
+        key = (url, params or ())
+        
+        cache = cache and self._cache is not None
+        if cache:
+            result = self._cache.get(key)
+            if result is not _MISSING:
+                return result
+        
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._fetch_json(url, params))
+            self._inflight[key] = future
+            future.add_done_callback(functools.partial(self._release_inflight, key))
+        result = await asyncio.shield(future)
+        
+        if cache:
+            self._cache.set(key, result)
+        return result
+    
+    def clear_cache(self) -> None:
+        """Drop all cached REST responses."""
+        if self._cache is not None:
+            self._cache.clear()
+    
+    def _invalidate_urls(self, urls: tuple) -> None:
+        """Drop cached responses for the given endpoints."""
+        if self._cache is not None:
+            self._cache.discard_if(lambda key: key[0] in urls)
+    
+    def _release_inflight(self, key: tuple, future: asyncio.Future) -> None:
+        """Forget a finished request, optionally after the coalescing window."""
+        if self.coalesce_window > 0 and not future.cancelled() and future.exception() is None:
+            asyncio.get_running_loop().call_later(
+                self.coalesce_window, self._drop_inflight, key, future
+            )
+        else:
+            self._drop_inflight(key, future)
+    
+    def _drop_inflight(self, key: tuple, future: asyncio.Future) -> None:
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
+    
+    async def _fetch_json(self, url: str, params: Optional[_Params] = None) -> Dict[str, Any]:
+        """Perform a REST GET on the active transport and decode the JSON body."""
+        if self._http is not None:
+            response = await self._http.get(url, params=params)
+            response.raise_for_status()
+            return _json_loads(response.content)
         
-        url = f"{self.rest_endpoint}/akash/market/v1beta4/leases/list"
+        if not self._rest_session:
+            raise AkashAsyncClientError("Client not properly initialized. Use async context manager.")
         
         async with self._rest_session.get(url, params=params) as response:
             response.raise_for_status()
-            return await response.json()
+            # Decode the raw bytes; orjson skips the intermediate str
+            return _json_loads(await response.read())
     
     # gRPC methods (delegated to gRPC client)
     async def grpc_query_deployments(self, **kwargs) -> Dict[str, Any]:
         """Query deployments via gRPC."""
         if not self._grpc_client:
-            raise AkashAsyncClientError("gRPC endpoint not configured")
+            raise AkashAsyncClientError("gRPC endpoint not configured or gRPC unavailable")
         
         return await self._grpc_client.query_deployments(**kwargs)
     
     async def grpc_query_bids(self, **kwargs) -> Dict[str, Any]:
         """Query bids via gRPC."""
         if not self._grpc_client:
-            raise AkashAsyncClientError("gRPC endpoint not configured")
+            raise AkashAsyncClientError("gRPC endpoint not configured or gRPC unavailable")
         
         return await self._grpc_client.query_bids(**kwargs)
     
     async def grpc_query_leases(self, **kwargs) -> Dict[str, Any]:
         """Query leases via gRPC."""
         if not self._grpc_client:
-            raise AkashAsyncClientError("gRPC endpoint not configured")
+            raise AkashAsyncClientError("gRPC endpoint not configured or gRPC unavailable")
         
         return await self._grpc_client.query_leases(**kwargs)
     
     async def grpc_query_providers(self, **kwargs) -> Dict[str, Any]:
         """Query providers via gRPC."""
         if not self._grpc_client:
-            raise AkashAsyncClientError("gRPC endpoint not configured")
+            raise AkashAsyncClientError("gRPC endpoint not configured or gRPC unavailable")
         
         return await self._grpc_client.query_providers(**kwargs)
     
     # Streaming methods
+    @property
+    def supports_deployment_events(self) -> bool:
+        """
+        Whether stream_deployment_events can be used.
+        
+        Requires a gRPC client whose deployment Query service streams events
+        (see AkashGrpcClient.supports_deployment_events).
+        """
+        return self._grpc_client is not None and self._grpc_client.supports_deployment_events
+    
     async def stream_deployment_events(self, **kwargs) -> AsyncGenerator[Dict[str, Any], None]:
-        """Stream deployment events via gRPC."""
-        if not self._grpc_client:
-            raise AkashAsyncClientError("gRPC endpoint not configured")
+        """
+        Stream deployment events via gRPC, one at a time.
+        
+        Convenience wrapper over stream_deployment_events_batched; prefer the
+        batched form for high-volume streams. Requires a node whose deployment
+        Query service streams events (``supports_deployment_events``).
+        """
+        async for batch in self.stream_deployment_events_batched(**kwargs):
+            for event in batch:
+                yield event
+    
+    async def stream_deployment_events_batched(self,
+                                               max_batch: int = 64,
+                                               max_wait_ms: float = 50,
+                                               **kwargs) -> AsyncGenerator[List[Dict[str, Any]], None]:
+        """
+        Stream deployment events via gRPC in batches.
+        
+        A batch is yielded once it holds max_batch events or max_wait_ms has
+        passed since its first event, whichever comes first.
+        
+        Only available when ``supports_deployment_events`` is True; current
+        Akash releases have no such RPC, so use subscribe_deployment_events.
+        
+        Args:
+            max_batch: Maximum number of events per batch
+            max_wait_ms: Maximum time to hold a partial batch
+            **kwargs: Arguments for AkashGrpcClient.stream_deployment_events
+            
+        Returns:
+            Async generator of event lists
+            
+        Raises:
+            AkashAsyncClientError: If gRPC is unavailable or the node does not
+                stream deployment events
+        """
+        if not self.supports_deployment_events:
+            raise AkashAsyncClientError(
+                "Deployment event streaming needs a gRPC endpoint whose deployment "
+                "Query service streams events; use subscribe_deployment_events"
+            )
+        
+        source = self._grpc_client.stream_deployment_events(**kwargs).__aiter__()
+        loop = asyncio.get_running_loop()
+        max_wait = max_wait_ms / 1000
+        pending = None
+        
+        try:
+            while True:
+                # Block for the first event of a batch
+                pending = pending or asyncio.ensure_future(source.__anext__())
+                try:
+                    batch = [await pending]
+                except StopAsyncIteration:
+                    return
+                pending = None
+                deadline = loop.time() + max_wait
+                
+                while len(batch) < max_batch:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    # The pending read survives a timeout, so no event is lost
+                    pending = asyncio.ensure_future(source.__anext__())
+                    done, _ = await asyncio.wait((pending,), timeout=remaining)
+                    if not done:
+                        break
+                    task, pending = pending, None
+                    try:
+                        batch.append(task.result())
+                    except StopAsyncIteration:
+                        yield batch
+                        return
+                
+                yield batch
+        finally:
+            if pending is not None:
+                pending.cancel()
+    
+    # Tendermint event subscriptions
+    async def subscribe(self, query: str) -> AsyncGenerator[Dict[str, Any], None]:
+        """
+        Subscribe to Tendermint events over the RPC websocket.
+        
+        Events are pushed by the node as they happen, which replaces polling
+        the REST listings in a loop.
+        
+        Args:
+            query: Tendermint event query (e.g., "tm.event='NewBlock'")
+            
+        Returns:
+            Async generator of event results
+        """
+        if not self.rpc_endpoint:
+            raise AkashAsyncClientError("RPC endpoint not configured for subscriptions")
+        if not AIOHTTP_AVAILABLE:
+            raise AkashAsyncClientError("aiohttp is required for event subscriptions")
+        
+        async with AsyncExitStack() as stack:
+            session = self._rest_session
+            if session is None:
+                # The HTTP/2 transport has no websocket support
+                session = await stack.enter_async_context(aiohttp.ClientSession())
+            
+            ws = await stack.enter_async_context(
+                session.ws_connect(self.rpc_endpoint.rstrip('/') + "/websocket", heartbeat=30)
+            )
+            await ws.send_json({
+                "jsonrpc": "2.0",
+                "method": "subscribe",
+                "id": 1,
+                "params": {"query": query}
+            })
+            
+            async for message in ws:
+                if message.type != aiohttp.WSMsgType.TEXT:
+                    if message.type == aiohttp.WSMsgType.ERROR:
+                        raise AkashAsyncClientError(f"Subscription failed: {ws.exception()}")
+                    continue
+                
+                data = _json_loads(message.data)
+                if "error" in data:
+                    raise AkashAsyncClientError(f"Subscription failed: {data['error']}")
+                
+                # The first reply only acknowledges the subscription
+                result = data.get("result")
+                if result:
+                    yield result
+    
+    async def subscribe_deployment_events(self, owner: str) -> AsyncGenerator[Dict[str, Any], None]:
+        """
+        Subscribe to deployment transactions sent by an owner.
+        
+        Drop-in replacement for polling get_deployments(owner=...) in a loop.
+        
+        Args:
+            owner: Deployment owner address (akash1...)
+        
+        Returns:
+            Async generator of transaction events
+        
+        Raises:
+            AkashAsyncClientError: If owner is not an akash1 bech32 address
+        """
+        if not isinstance(owner, str) or not _AKASH_ADDRESS.fullmatch(owner):
+            raise AkashAsyncClientError(f"Invalid owner address: {owner!r}")
         
-        async for event in self._grpc_client.stream_deployment_events(**kwargs):
+        query = f"tm.event='Tx' AND message.module='deployment' AND message.sender='{owner}'"
+        async for event in self.subscribe(query):
             yield event
     
     # Transaction methods
+    def batch(self, wallet: Wallet, gas_limit: Optional[int] = None) -> "TxBatch":
+        """
+        Collect several messages into a single signed transaction.
+        
+        Usage:
+            async with client.batch(wallet) as batch:
+                batch.add_bid(order_id, "100uakt")
+                batch.add_bid(other_order_id, "120uakt")
+            print(batch.result)
+        
+        Args:
+            wallet: Wallet for signing
+            gas_limit: Gas limit for the transaction (defaults to the sum of
+                the per-message defaults)
+            
+        Returns:
+            TxBatch context manager
+        """
+        if not self._transaction_signer:
+            raise AkashAsyncClientError("RPC endpoint not configured for transactions")
+        
+        return TxBatch(self, wallet, gas_limit)
+    
     async def create_deployment(self,
                                wallet: Wallet,
                                sdl: Dict[str, Any],
@@ -232,35 +752,9 @@ class AkashAsyncClient:
         Returns:
             Transaction result
         """
-        if not self._transaction_signer:
-            raise AkashAsyncClientError("RPC endpoint not configured for transactions")
-        
-        # Get account info
-        account_info = await self._get_account_info(wallet.address)
-        
-        # Create deployment message
-        msg = self._transaction_signer.create_deployment_msg(
-            wallet.address, sdl, deposit
-        )
-        
-        # Create and sign transaction
-        tx_info = TransactionInfo(
-            chain_id=self.chain_id,
-            account_number=account_info['account_number'],
-            sequence=account_info['sequence'],
-            fee={}
-        )
-        
-        transaction = self._transaction_signer.create_transaction(
-            wallet, [msg], tx_info, gas_limit
-        )
-        
-        signed_tx = self._transaction_signer.sign_transaction(
-            wallet, transaction, tx_info
-        )
-        
-        # Broadcast transaction
-        return await self._transaction_signer.broadcast_transaction(signed_tx)
+        async with self.batch(wallet, gas_limit) as batch:
+            batch.add_deployment(sdl, deposit)
+        return batch.result
     
     async def create_bid(self,
                         wallet: Wallet,
@@ -268,121 +762,246 @@ class AkashAsyncClient:
                         price: str,
                         gas_limit: int = 200000) -> Dict[str, Any]:
         """Create a bid on the blockchain."""
-        if not self._transaction_signer:
-            raise AkashAsyncClientError("RPC endpoint not configured for transactions")
-        
-        # Get account info
-        account_info = await self._get_account_info(wallet.address)
-        
-        # Create bid message
-        msg = self._transaction_signer.create_bid_msg(
-            wallet.address, order_id, price
-        )
-        
-        # Create and sign transaction
-        tx_info = TransactionInfo(
-            chain_id=self.chain_id,
-            account_number=account_info['account_number'],
-            sequence=account_info['sequence'],
-            fee={}
-        )
-        
-        transaction = self._transaction_signer.create_transaction(
-            wallet, [msg], tx_info, gas_limit
-        )
-        
-        signed_tx = self._transaction_signer.sign_transaction(
-            wallet, transaction, tx_info
-        )
-        
-        # Broadcast transaction
-        return await self._transaction_signer.broadcast_transaction(signed_tx)
+        async with self.batch(wallet, gas_limit) as batch:
+            batch.add_bid(order_id, price)
+        return batch.result
     
     async def create_lease(self,
                           wallet: Wallet,
                           bid_id: Dict[str, Any],
                           gas_limit: int = 200000) -> Dict[str, Any]:
         """Create a lease on the blockchain."""
-        if not self._transaction_signer:
-            raise AkashAsyncClientError("RPC endpoint not configured for transactions")
-        
-        # Get account info
-        account_info = await self._get_account_info(wallet.address)
+        async with self.batch(wallet, gas_limit) as batch:
+            batch.add_lease(bid_id)
+        return batch.result
+    
+    async def _account_info_and_msgs(self, address: str, builders: List[tuple]) -> tuple:
+        """
+        Fetch account info and build transaction messages.
         
-        # Create lease message
-        msg = self._transaction_signer.create_lease_msg(
-            wallet.address, wallet.address, bid_id
-        )
+        Message construction is a few dict builds, so it runs inline; handing
+        it to the thread pool would cost more than the work itself.
         
-        # Create and sign transaction
-        tx_info = TransactionInfo(
-            chain_id=self.chain_id,
-            account_number=account_info['account_number'],
-            sequence=account_info['sequence'],
-            fee={}
-        )
+        Args:
+            address: Account address to look up
+            builders: (signer method, args) pairs that build the messages
         
-        transaction = self._transaction_signer.create_transaction(
-            wallet, [msg], tx_info, gas_limit
-        )
+        Returns:
+            Tuple of (account info, messages)
+        """
+        msgs = _build_msgs(builders)
+        return await self._get_account_info(address), msgs
+    
+    async def _sign_and_broadcast(self,
+                                  wallet: Wallet,
+                                  msgs: List[Dict[str, Any]],
+                                  account_info: Dict[str, Any],
+                                  gas_limit: int) -> Dict[str, Any]:
+        """
+        Sign and broadcast messages, keeping the cached sequence in step.
         
-        signed_tx = self._transaction_signer.sign_transaction(
-            wallet, transaction, tx_info
-        )
+        Must be called with the wallet's account lock held. A sequence mismatch
+        refetches the account and retries once with the chain's sequence.
+        """
+        loop = asyncio.get_running_loop()
         
-        # Broadcast transaction
-        return await self._transaction_signer.broadcast_transaction(signed_tx)
+        for attempt in range(2):
+            tx_info = TransactionInfo(
+                chain_id=self.chain_id,
+                account_number=account_info['account_number'],
+                sequence=account_info['sequence'],
+                fee={}
+            )
+            
+            # Encoding and ECDSA signing are CPU-bound; keep them off the loop
+            signed_tx = await loop.run_in_executor(
+                self._signing_executor, _build_and_sign,
+                self._transaction_signer, wallet, msgs, tx_info, gas_limit
+            )
+            
+            try:
+                result = await self._transaction_signer.broadcast_transaction(signed_tx)
+            except AkashTransactionError as e:
+                self.invalidate_account(wallet.address)
+                if attempt == 0 and _is_sequence_mismatch(str(e)):
+                    account_info = await self._get_account_info(wallet.address)
+                    continue
+                raise
+            
+            # broadcast_tx_sync returns the CheckTx fields at the top level
+            check_tx = result.get('check_tx', result) if isinstance(result, dict) else {}
+            code = check_tx.get('code', 0)
+            if code == 0:
+                # Accepted into the mempool, so the sequence is consumed
+                cached = self._account_cache.get(wallet.address)
+                if cached is not None:
+                    cached['sequence'] += 1
+            else:
+                self.invalidate_account(wallet.address)
+                if attempt == 0 and code == _SEQUENCE_MISMATCH_CODE:
+                    account_info = await self._get_account_info(wallet.address)
+                    continue
+            
+            return result
     
     async def _get_account_info(self, address: str) -> Dict[str, Any]:
-        """Get account information for transaction signing."""
-        if not self._rest_session:
-            raise AkashAsyncClientError("REST session not available")
-        
-        url = f"{self.rest_endpoint}/cosmos/auth/v1beta1/accounts/{address}"
+        """
+        Get account information for transaction signing.
         
-        async with self._rest_session.get(url) as response:
-            response.raise_for_status()
-            data = await response.json()
+        The account number and sequence are cached per address and the sequence
+        is advanced locally after each accepted broadcast, so only the first
+        transaction from a wallet (or one after invalidate_account) queries
+        the chain.
+        """
+        cached = self._account_cache.get(address)
+        if cached is None:
+            # Bypass request sharing so a refetch never sees a stale sequence
+            url = self._url_account_tpl.format(address)
+            data = await self._fetch_json(url)
             
             account = data.get('account', {})
-            return {
-                'account_number': int(account.get('account_number', 0)),
-                'sequence': int(account.get('sequence', 0))
+            cached = {
+                'account_number': _u64_from_str(account.get('account_number')),
+                'sequence': _u64_from_str(account.get('sequence'))
             }
+            self._account_cache[address] = cached
+        
+        return dict(cached)
+    
+    def invalidate_account(self, address: str) -> None:
+        """
+        Drop the cached account number and sequence for an address.
+        
+        Call this after broadcasting from the same wallet through another
+        client so the next transaction refetches the sequence.
+        """
+        self._account_cache.pop(address, None)
     
     # Health checks
     async def health_check(self) -> Dict[str, bool]:
-        """Check health of all configured endpoints."""
-        health = {}
+        """Check health of all configured endpoints concurrently."""
         
-        # REST health check
-        try:
+        async def _rest() -> bool:
+            url = self._url_node_info
+            if self._http is not None:
+                response = await self._http.get(url)
+                return response.status_code == 200
             if self._rest_session:
-                url = f"{self.rest_endpoint}/cosmos/base/tendermint/v1beta1/node_info"
                 async with self._rest_session.get(url) as response:
-                    health['rest'] = response.status == 200
-            else:
-                health['rest'] = False
-        except Exception:
-            health['rest'] = False
+                    return response.status == 200
+            return False
         
-        # gRPC health check
-        if self._grpc_client:
-            health['grpc'] = await self._grpc_client.health_check()
-        else:
-            health['grpc'] = False
+        async def _grpc() -> bool:
+            if not self._grpc_client:
+                return False
+            return await self._grpc_client.health_check()
         
-        # RPC health check
-        if self._transaction_signer:
-            try:
-                # Simple RPC call to check connectivity
-                health['rpc'] = True  # Placeholder
-            except Exception:
-                health['rpc'] = False
-        else:
-            health['rpc'] = False
+        async def _rpc() -> bool:
+            # Simple RPC connectivity check (placeholder)
+            return self._transaction_signer is not None
+        
+        results = await asyncio.gather(_rest(), _grpc(), _rpc(), return_exceptions=True)
+        return {
+            name: result is True
+            for name, result in zip(('rest', 'grpc', 'rpc'), results)
+        }
+
+
+def _build_and_sign(signer: AkashTransactionSigner,
+                    wallet: Wallet,
+                    msgs: List[Dict[str, Any]],
+                    tx_info: TransactionInfo,
+                    gas_limit: int) -> Dict[str, Any]:
+    """Create and sign a transaction (module level so process pools can pickle it)."""
+    transaction = signer.create_transaction(wallet, msgs, tx_info, gas_limit)
+    return signer.sign_transaction(wallet, transaction, tx_info)
+
+
+def _build_msgs(builders: List[tuple]) -> List[Dict[str, Any]]:
+    """Run deferred message builders."""
+    return [build(*args) for build, args in builders]
+
+
+class TxBatch:
+    """
+    Buffer transaction messages and broadcast them as one transaction.
+    
+    Created by AkashAsyncClient.batch(). Messages added inside the async with
+    block are signed once and broadcast once on exit; nothing is sent if the
+    block raises. The broadcast response is available as `result`.
+    """
+    
+    __slots__ = (
+        "_client", "_signer", "wallet", "gas_limit", "result",
+        "_builders", "_gas_estimate", "_kinds",
+    )
+    
+    # Default gas per message type, summed when no gas limit is given
+    _GAS = {"deployment": 300000, "bid": 200000, "lease": 200000}
+    
+    def __init__(self, client: AkashAsyncClient, wallet: Wallet, gas_limit: Optional[int] = None):
+        self._client = client
+        self._signer = client._transaction_signer
+        self.wallet = wallet
+        self.gas_limit = gas_limit
+        self.result: Optional[Dict[str, Any]] = None
+        self._builders: List[tuple] = []
+        self._gas_estimate = 0
+        self._kinds = set()
+    
+    def __len__(self) -> int:
+        return len(self._builders)
+    
+    def _add(self, kind: str, build, *args) -> None:
+        self._builders.append((build, args))
+        self._gas_estimate += self._GAS[kind]
+        self._kinds.add(kind)
+    
+    def add_deployment(self, sdl: Dict[str, Any], deposit: str = "10000000uakt") -> None:
+        """Add a deployment creation message."""
+        self._add("deployment", self._signer.create_deployment_msg,
+                  self.wallet.address, sdl, deposit)
+    
+    def add_bid(self, order_id: Dict[str, Any], price: str) -> None:
+        """Add a bid creation message."""
+        self._add("bid", self._signer.create_bid_msg,
+                  self.wallet.address, order_id, price)
+    
+    def add_lease(self, bid_id: Dict[str, Any]) -> None:
+        """Add a lease creation message."""
+        self._add("lease", self._signer.create_lease_msg,
+                  self.wallet.address, self.wallet.address, bid_id)
+    
+    async def __aenter__(self) -> "TxBatch":
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None and self._builders:
+            self.result = await self.broadcast()
+    
+    async def broadcast(self) -> Dict[str, Any]:
+        """Sign and broadcast the buffered messages as a single transaction."""
+        builders, self._builders = self._builders, []
+        kinds, self._kinds = self._kinds, set()
+        gas_limit = self.gas_limit or self._gas_estimate
+        self._gas_estimate = 0
+        
+        client = self._client
+        address = self.wallet.address
+        async with client._account_locks[address]:
+            # Build the messages while the account info is fetched
+            account_info, msgs = await client._account_info_and_msgs(address, builders)
+            result = await client._sign_and_broadcast(self.wallet, msgs, account_info, gas_limit)
+        
+        # Cached listings no longer reflect the chain
+        urls = ()
+        if "deployment" in kinds:
+            urls += (client._url_deployments,)
+        if kinds & {"bid", "lease"}:
+            urls += (client._url_bids, client._url_leases)
+        client._invalidate_urls(urls)
         
-        return health
+        return result
 
 
 # Convenience functions
@@ -398,3 +1017,155 @@ async def create_async_client(rest_endpoint: str,
         **kwargs
     )
     return client
+
+
+async def _closing_default_channels(main):
+    """Await a coroutine, then close the loop's default gRPC channels."""
+    try:
+        return await main
+    finally:
+        await close_default_channels()
+
+
+def run_async(main):
+    """
+    Run a coroutine to completion, on uvloop when it is installed.
+    
+    Drop-in replacement for asyncio.run(). The global event loop policy is
+    left untouched, so importing the SDK never changes an application's loop.
+    Channels cached by get_default_channel() on the loop are closed before
+    it shuts down.
+    
+    Args:
+        main: Coroutine to run
+        
+    Returns:
+        The coroutine's result
+    """
+    main = _closing_default_channels(main)
+    if not UVLOOP_AVAILABLE:
+        return asyncio.run(main)
+    
+    if sys.version_info >= (3, 11):
+        with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+            return runner.run(main)
+    
+    loop = uvloop.new_event_loop()
+    try:
+        asyncio.set_event_loop(loop)
+        return loop.run_until_complete(main)
+    finally:
+        try:
+            loop.run_until_complete(loop.shutdown_asyncgens())
+        finally:
+            asyncio.set_event_loop(None)
+            loop.close()
+
+
+# Process-wide shared client, and its creation while __aenter__ is running
+_shared_client: Optional[AkashAsyncClient] = None
+_shared_loop: Optional[asyncio.AbstractEventLoop] = None
+_shared_pending: Optional[asyncio.Future] = None
+_atexit_registered = False
+
+
+def _detach_shared_client(loop: asyncio.AbstractEventLoop) -> None:
+    """Drop a shared client that belongs to another loop, closing it if possible."""
+    global _shared_client, _shared_loop, _shared_pending
+    
+    client, old_loop = _shared_client, _shared_loop
+    _shared_client = _shared_loop = _shared_pending = None
+    if client is None or old_loop is None or old_loop.is_closed():
+        return
+    if old_loop.is_running():
+        # Still serving another thread: close the client on its own loop
+        asyncio.run_coroutine_threadsafe(client.__aexit__(None, None, None), old_loop)
+    else:
+        logging.warning(
+            "Shared async client recreated for a new event loop; the previous "
+            "loop is stopped, so its client could not be closed"
+        )
+
+
+async def get_shared_async_client(rest_endpoint: str = "https://api.akash.network",
+                                  **kwargs) -> AkashAsyncClient:
+    """
+    Get a process-wide async client that keeps its connection pool warm.
+    
+    The client is created and entered on first use and then reused by every
+    caller on the same event loop, so TCP and TLS setup is paid only once.
+    Concurrent first calls wait for the same client. Connection arguments
+    are only honoured when the client is (re)created; a client left over
+    from another event loop is closed on that loop when it is still running.
+    
+    Args:
+        rest_endpoint: REST API endpoint
+        **kwargs: Additional AkashAsyncClient arguments
+        
+    Returns:
+        Initialized AkashAsyncClient
+    """
+    global _shared_client, _shared_loop, _shared_pending, _atexit_registered
+    
+    loop = asyncio.get_running_loop()
+    if _shared_loop is loop:
+        if _shared_client is not None:
+            return _shared_client
+        if _shared_pending is not None:
+            # A waiter being cancelled must not cancel the creation itself
+            return await asyncio.shield(_shared_pending)
+    elif _shared_loop is not None:
+        _detach_shared_client(loop)
+    
+    pending = loop.create_future()
+    _shared_loop, _shared_pending = loop, pending
+    client = AkashAsyncClient(rest_endpoint=rest_endpoint, **kwargs)
+    try:
+        await client.__aenter__()
+    except BaseException as e:
+        if _shared_pending is pending:
+            _shared_loop = _shared_pending = None
+        if isinstance(e, asyncio.CancelledError):
+            pending.cancel()
+        else:
+            pending.set_exception(e)
+            # Waiters re-raise it; don't log it as never retrieved
+            pending.exception()
+        raise
+    
+    if _shared_pending is pending:
+        _shared_client, _shared_pending = client, None
+    pending.set_result(client)
+    
+    if not _atexit_registered:
+        atexit.register(_close_shared_client_at_exit)
+        _atexit_registered = True
+    
+    return client
+
+
+async def close_shared_async_client() -> None:
+    """Close the process-wide async client, if one was created."""
+    global _shared_client, _shared_loop, _shared_pending
+    
+    pending = _shared_pending
+    if pending is not None and _shared_loop is asyncio.get_running_loop():
+        # Let a creation in progress finish, so its client is closed too
+        try:
+            await asyncio.shield(pending)
+        except Exception:
+            pass
+    
+    client, _shared_client, _shared_loop, _shared_pending = _shared_client, None, None, None
+    if client is not None:
+        await client.__aexit__(None, None, None)
+
+
+def _close_shared_client_at_exit() -> None:
+    """Best-effort cleanup of the shared client at interpreter exit."""
+    if _shared_client is None or _shared_loop is None or _shared_loop.is_closed():
+        return
+    try:
+        _shared_loop.run_until_complete(close_shared_async_client())
+    except Exception:
+        pass
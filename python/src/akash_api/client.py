@@ -5,33 +5,68 @@ This client provides a simplified interface for common operations.
 """
 
 import logging
+import socket
 from typing import Optional, Dict, Any, List
 
-# Try to import requests, fallback to a simple mock if not available
+from ._cache import _MISSING, _TTLCache
+
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.connection import HTTPConnection
+    from urllib3.util.retry import Retry
     REQUESTS_AVAILABLE = True
 except ImportError:
+    # AkashClient refuses to start without requests
+    requests = None
     REQUESTS_AVAILABLE = False
-    # Simple mock for when requests is not available
-    class MockResponse:
-        def json(self):
-            return {"message": "requests module not available - install with: pip install requests"}
-        def raise_for_status(self):
-            pass
-    
-    class requests:
-        class exceptions:
-            RequestException = Exception
-        
-        @staticmethod
-        def get(url, params=None, timeout=None):
-            return MockResponse()
+
+if REQUESTS_AVAILABLE:
+    # urllib3's defaults already set TCP_NODELAY; add TCP keepalive
+    _SOCKET_OPTIONS = HTTPConnection.default_socket_options + [
+        (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+    ]
+    
+    class _SocketOptionsAdapter(HTTPAdapter):
+        """HTTPAdapter that applies _SOCKET_OPTIONS to its connection pools."""
+        
+        def init_poolmanager(self, *args, **kwargs):
+            kwargs['socket_options'] = _SOCKET_OPTIONS
+            super().init_poolmanager(*args, **kwargs)
+
+
+def _create_session():
+    """Create a pooled session that retries transient gateway errors."""
+    session = requests.Session()
+    adapter = _SocketOptionsAdapter(
+        pool_connections=16,
+        pool_maxsize=32,
+        max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504])
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+# Prefer orjson for decoding response bodies when installed (performance extra)
+try:
+    import orjson
+    _json_loads = orjson.loads
+    ORJSON_AVAILABLE = True
+except ImportError:
+    import json
+    _json_loads = json.loads
+    ORJSON_AVAILABLE = False
+
+
+# Query parameter names, in the order the get_* methods take them
+_DEPLOYMENT_FILTERS = ('owner', 'state', 'dseq')
+_MARKET_FILTERS = ('owner', 'dseq', 'gseq', 'oseq', 'provider', 'state')
 
 
 class AkashClientError(Exception):
     """Base exception for Akash client errors."""
-    pass
+    __slots__ = ()
 
 
 class AkashClient:
@@ -42,29 +77,105 @@ class AkashClient:
     bids, leases, and providers. It works with REST endpoints.
     """
     
+    __slots__ = ("rest_endpoint", "timeout", "grpc_endpoint", "prefer_grpc", "_session", "_grpc", "_cache")
+    
     def __init__(self, 
                  rest_endpoint: str,
-                 timeout: int = 30):
+                 timeout: int = 30,
+                 grpc_endpoint: Optional[str] = None,
+                 prefer_grpc: bool = False,
+                 cache_ttl: float = 3.0,
+                 cache_size: int = 128):
         """
         Initialize the Akash client.
         
         Args:
             rest_endpoint: The REST API endpoint URL (e.g., "https://api.akash.network")
             timeout: Request timeout in seconds
+            grpc_endpoint: Optional gRPC endpoint for the gRPC fast path
+            prefer_grpc: Send the list queries gRPC supports over gRPC when
+                grpc_endpoint is set; REST is used otherwise
+            cache_ttl: Seconds deployment and provider lookups are served from
+                memory (0 disables the cache)
+            cache_size: Maximum number of cached responses
         """
+        if not REQUESTS_AVAILABLE:
+            raise AkashClientError("requests is required for AkashClient. Install with: pip install requests")
+        
         self.rest_endpoint = rest_endpoint.rstrip('/')
         self.timeout = timeout
+        self.grpc_endpoint = grpc_endpoint
+        self.prefer_grpc = prefer_grpc
+        
+        # Reused across calls so connections stay open between requests
+        self._session = _create_session()
+        self._grpc = None
+        self._cache = _TTLCache(cache_ttl, cache_size) if cache_ttl > 0 else None
     
-    def _make_rest_request(self, path: str, params: Optional[Dict] = None) -> Dict[Any, Any]:
-        """Make a REST API request."""
-        url = f"{self.rest_endpoint}/{path.lstrip('/')}"
+    def _grpc_client(self):
+        """Return the gRPC fast-path client, created on first use."""
+        if self._grpc is None:
+            from .grpc_client import SyncGrpcWrapper
+            self._grpc = SyncGrpcWrapper(self.grpc_endpoint, timeout=self.timeout)
+        return self._grpc
+    
+    def close(self):
+        """Close the underlying HTTP session, gRPC client and their connections."""
+        self._session.close()
+        if self._grpc is not None:
+            self._grpc.close()
+            self._grpc = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+    
+    def clear_cache(self):
+        """Drop all cached REST responses."""
+        if self._cache is not None:
+            self._cache.clear()
+    
+    def _make_rest_request(self,
+                           path: str,
+                           params: Optional[Any] = None,
+                           cache: bool = False) -> Dict[Any, Any]:
+        """
+        Make a REST API request.
+        
+        With cache=True, a response fetched within the last cache_ttl seconds
+        is returned from memory. Cached responses are shared, so callers must
+        not mutate them.
+        """
+        cache = cache and self._cache is not None
+        if cache:
+            key = (path, tuple(params) if params else ())
+            result = self._cache.get(key)
+            if result is not _MISSING:
+                return result
+        
+        result = self._fetch(path, params)
+        if cache:
+            self._cache.set(key, result)
+        return result
+    
+    def _fetch(self, path: str, params: Optional[Any] = None) -> Dict[Any, Any]:
+        """Perform the HTTP request and decode the JSON body."""
+        # Callers pass constant paths that already start with '/'
+        if path[:1] == '/':
+            url = self.rest_endpoint + path
+        else:
+            url = "".join((self.rest_endpoint, '/', path))
         
         try:
-            response = requests.get(url, params=params, timeout=self.timeout)
+            response = self._session.get(url, params=params, timeout=self.timeout)
             response.raise_for_status()
-            return response.json()
+            return _json_loads(response.content)
         except requests.exceptions.RequestException as e:
             raise AkashClientError(f"REST request failed: {e}")
+        except ValueError as e:
+            raise AkashClientError(f"Invalid JSON response: {e}")
     
     # Deployment methods
     def get_deployments(self, 
@@ -82,15 +193,13 @@ class AkashClient:
         Returns:
             Dictionary containing deployment data
         """
-        params = {}
-        if owner:
-            params['owner'] = owner
-        if state:
-            params['state'] = state
-        if dseq:
-            params['dseq'] = str(dseq)
+        if self.prefer_grpc and self.grpc_endpoint and not dseq:
+            return self._grpc_client().query_deployments(owner=owner, state=state)
+        
+        values = (owner, state, dseq)
+        params = [(key, value) for key, value in zip(_DEPLOYMENT_FILTERS, values) if value]
         
-        return self._make_rest_request('/akash/deployment/v1beta3/deployments', params)
+        return self._make_rest_request('/akash/deployment/v1beta3/deployments', params, cache=True)
     
     def get_deployment(self, owner: str, dseq: int) -> Dict[Any, Any]:
         """
@@ -104,7 +213,7 @@ class AkashClient:
             Dictionary containing deployment data
         """
         path = f'/akash/deployment/v1beta3/deployments/{owner}/{dseq}'
-        return self._make_rest_request(path)
+        return self._make_rest_request(path, cache=True)
     
     # Market methods
     def get_bids(self, 
@@ -113,7 +222,8 @@ class AkashClient:
                  gseq: Optional[int] = None,
                  oseq: Optional[int] = None,
                  provider: Optional[str] = None,
-                 state: Optional[str] = None) -> Dict[Any, Any]:
+                 state: Optional[str] = None,
+                 cache: bool = False) -> Dict[Any, Any]:
         """
         Get bids based on filter criteria.
         
@@ -124,19 +234,20 @@ class AkashClient:
             oseq: Filter by order sequence
             provider: Filter by provider address
             state: Filter by bid state
+            cache: Allow a recently cached response (bids change quickly,
+                so this is off by default)
             
         Returns:
             Dictionary containing bid data
         """
-        params = {}
-        for key, value in [
-            ('owner', owner), ('dseq', dseq), ('gseq', gseq), 
-            ('oseq', oseq), ('provider', provider), ('state', state)
-        ]:
-            if value is not None:
-                params[key] = str(value)
+        # gRPC queries don't take the order ID filters
+        if self.prefer_grpc and self.grpc_endpoint and dseq is None and gseq is None and oseq is None:
+            return self._grpc_client().query_bids(owner=owner, provider=provider, state=state)
         
-        return self._make_rest_request('/akash/market/v1beta4/bids/list', params)
+        values = (owner, dseq, gseq, oseq, provider, state)
+        params = [(key, value) for key, value in zip(_MARKET_FILTERS, values) if value is not None]
+        
+        return self._make_rest_request('/akash/market/v1beta4/bids/list', params, cache=cache)
     
     def get_leases(self,
                    owner: Optional[str] = None,
@@ -144,7 +255,8 @@ class AkashClient:
                    gseq: Optional[int] = None,
                    oseq: Optional[int] = None,
                    provider: Optional[str] = None,
-                   state: Optional[str] = None) -> Dict[Any, Any]:
+                   state: Optional[str] = None,
+                   cache: bool = False) -> Dict[Any, Any]:
         """
         Get leases based on filter criteria.
         
@@ -155,19 +267,20 @@ class AkashClient:
             oseq: Filter by order sequence  
             provider: Filter by provider address
             state: Filter by lease state
+            cache: Allow a recently cached response (leases change quickly,
+                so this is off by default)
             
         Returns:
             Dictionary containing lease data
         """
-        params = {}
-        for key, value in [
-            ('owner', owner), ('dseq', dseq), ('gseq', gseq),
-            ('oseq', oseq), ('provider', provider), ('state', state)
-        ]:
-            if value is not None:
-                params[key] = str(value)
+        # gRPC queries don't take the order ID filters
+        if self.prefer_grpc and self.grpc_endpoint and dseq is None and gseq is None and oseq is None:
+            return self._grpc_client().query_leases(owner=owner, provider=provider, state=state)
+        
+        values = (owner, dseq, gseq, oseq, provider, state)
+        params = [(key, value) for key, value in zip(_MARKET_FILTERS, values) if value is not None]
         
-        return self._make_rest_request('/akash/market/v1beta4/leases/list', params)
+        return self._make_rest_request('/akash/market/v1beta4/leases/list', params, cache=cache)
     
     # Provider methods
     def get_providers(self) -> Dict[Any, Any]:
@@ -177,7 +290,10 @@ class AkashClient:
         Returns:
             Dictionary containing provider data
         """
-        return self._make_rest_request('/akash/provider/v1beta3/providers')
+        if self.prefer_grpc and self.grpc_endpoint:
+            return self._grpc_client().query_providers()
+        
+        return self._make_rest_request('/akash/provider/v1beta3/providers', cache=True)
     
     def get_provider(self, address: str) -> Dict[Any, Any]:
         """
@@ -190,7 +306,7 @@ class AkashClient:
             Dictionary containing provider data
         """
         path = f'/akash/provider/v1beta3/providers/{address}'
-        return self._make_rest_request(path)
+        return self._make_rest_request(path, cache=True)
     
     # Utility methods
     def health_check(self) -> bool:
@@ -6,9 +6,15 @@ retry logic, and error handling.
 """
 
 import asyncio
+import functools
+import itertools
 import logging
-from typing import Optional, Dict, Any, List, AsyncGenerator, Union
-from contextlib import asynccontextmanager
+import random
+import sys
+import threading
+import time
+import weakref
+from typing import Optional, Dict, Any, List, AsyncGenerator, Union, Hashable, Tuple
 
 try:
     import grpc
@@ -18,21 +24,481 @@ except ImportError:
     GRPC_AVAILABLE = False
     grpc = None
 
-# Import protobuf services (with fallback)
+# Import protobuf services (with fallback). The generated Akash query
+# modules import google.api (googleapis-common-protos) and the cosmos.* /
+# cosmos_proto modules generated from the cosmos-sdk protos; the latter are
+# not shipped with this package, so the import error is kept for the message
+_PROTOBUF_IMPORT_ERROR = None
 try:
-    from akash_api.akash.deployment.v1beta3 import service_pb2_grpc as deployment_grpc
-    from akash_api.akash.market.v1beta4 import service_pb2_grpc as market_grpc  
-    from akash_api.akash.provider.v1beta3 import service_pb2_grpc as provider_grpc
-    from akash_api.akash.cert.v1beta3 import service_pb2_grpc as cert_grpc
+    from akash_api.akash.deployment.v1beta3 import query_pb2_grpc as deployment_grpc
+    from akash_api.akash.market.v1beta4 import query_pb2_grpc as market_grpc
+    from akash_api.akash.provider.v1beta3 import query_pb2_grpc as provider_grpc
+    from akash_api.akash.cert.v1beta3 import query_pb2_grpc as cert_grpc
+    from akash_api.akash.deployment.v1beta3 import query_pb2 as deployment_pb2
+    from google.protobuf import message_factory
+    from google.protobuf.json_format import MessageToDict, ParseDict
     PROTOBUF_AVAILABLE = True
-except ImportError:
+    _QUERY_STUBS = (
+        deployment_grpc.QueryStub,
+        market_grpc.QueryStub,
+        provider_grpc.QueryStub,
+        cert_grpc.QueryStub,
+    )
+except ImportError as exc:
     PROTOBUF_AVAILABLE = False
+    _PROTOBUF_IMPORT_ERROR = exc
     deployment_grpc = market_grpc = provider_grpc = cert_grpc = None
+    _QUERY_STUBS = ()
+
+# Deployment events can only be streamed over gRPC when the generated
+# deployment Query service has a StreamDeploymentEvents server-streaming
+# method; current Akash releases do not define one
+DEPLOYMENT_EVENTS_AVAILABLE = PROTOBUF_AVAILABLE and hasattr(
+    deployment_grpc.QueryServicer, "StreamDeploymentEvents"
+)
+
+from ._cache import _MISSING, _TTLCache
 
 
 class AkashGrpcClientError(Exception):
     """Base exception for gRPC client errors."""
-    pass
+    __slots__ = ()
+
+
+class AkashGrpcTransientError(AkashGrpcClientError):
+    """gRPC error that may go away on a later attempt (unavailable, timed out, throttled)."""
+    __slots__ = ()
+
+
+_backend_checked = False
+
+
+def _check_protobuf_backend():
+    """Warn once if protobuf fell back to its pure-Python runtime."""
+    global _backend_checked
+    if _backend_checked:
+        return
+    _backend_checked = True
+    
+    from google.protobuf.internal import api_implementation
+    if api_implementation.Type() == "python":
+        logging.warning(
+            "protobuf is using its pure-Python runtime, which is several times slower; "
+            "install a protobuf wheel with the upb backend for this platform"
+        )
+
+
+# Codes worth retrying (the call may succeed on another attempt) and the
+# subset that counts towards opening an endpoint's circuit breaker
+if GRPC_AVAILABLE:
+    _RETRYABLE_CODES = frozenset((
+        grpc.StatusCode.UNAVAILABLE,
+        grpc.StatusCode.RESOURCE_EXHAUSTED,
+        grpc.StatusCode.DEADLINE_EXCEEDED,
+    ))
+    _BREAKER_CODES = frozenset((
+        grpc.StatusCode.UNAVAILABLE,
+        grpc.StatusCode.DEADLINE_EXCEEDED,
+    ))
+    # Exception raised for each status code; anything else is permanent
+    _CODE_TO_EXC = {
+        code: AkashGrpcTransientError
+        for code in _RETRYABLE_CODES | {grpc.StatusCode.ABORTED}
+    }
+else:
+    _RETRYABLE_CODES = _BREAKER_CODES = frozenset()
+    _CODE_TO_EXC = {}
+
+
+def _rpc_error(message: str, code: Any, details: Optional[str]) -> AkashGrpcClientError:
+    """Log a failed RPC and build the exception matching its status code."""
+    logging.error("gRPC error: %s: %s", code, details)
+    return _CODE_TO_EXC.get(code, AkashGrpcClientError)(f"{message}: {details}")
+
+# Decorrelated-jitter backoff bounds, in seconds
+_RETRY_BASE = 0.1
+_RETRY_CAP = 5.0
+
+
+class _BreakerState:
+    """Consecutive failure count, open time and half-open probe flag for one endpoint."""
+    __slots__ = ("failures", "opened_at", "trial")
+    
+    def __init__(self):
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self.trial = False
+
+
+def _translate_grpc_errors(method):
+    """Raise AioRpcError escaping a client method as AkashGrpcClientError."""
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        try:
+            return await method(self, *args, **kwargs)
+        except grpc.aio.AioRpcError as e:
+            raise _rpc_error("gRPC call failed", e.code(), e.details()) from e
+    
+    return wrapper
+
+
+def _freeze(value: Any) -> Hashable:
+    """Convert call arguments into a hashable key."""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _coalesced(method):
+    """
+    Serve a query from the TTL cache or share one in-flight call.
+    
+    Results are cached for ``cache_ttl`` seconds; pass ``bypass_cache=True``
+    to force a fresh call. Callers that issue the same query while an earlier
+    one is still running await the same result instead of sending another
+    RPC. The result object is shared, so callers must not mutate it.
+    """
+    @functools.wraps(method)
+    async def wrapper(self, *args, bypass_cache: bool = False, **kwargs):
+        key = (method.__name__, _freeze(args), _freeze(kwargs))
+        
+        if self._cache is not None and not bypass_cache:
+            cached = self._cache.get(key)
+            if cached is not _MISSING:
+                return cached
+        
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(method(self, *args, **kwargs))
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        result = await asyncio.shield(future)
+        
+        if self._cache is not None:
+            self._cache.set(key, result)
+        return result
+    
+    return wrapper
+
+
+# Stub instances per channel; entries go away when the channel is collected
+_STUB_CACHE: "weakref.WeakKeyDictionary[Any, Dict[Any, Any]]" = weakref.WeakKeyDictionary()
+
+
+def get_stub(channel, stub_cls):
+    """
+    Get a service stub for a channel, building it only once.
+    
+    Generated stubs register one multi-callable per RPC method when they are
+    constructed, so reusing the instance makes repeated lookups O(1).
+    
+    Args:
+        channel: gRPC channel
+        stub_cls: Generated stub class (e.g., deployment_grpc.QueryStub)
+        
+    Returns:
+        Stub instance bound to the channel
+    """
+    stubs = _STUB_CACHE.get(channel)
+    if stubs is None:
+        stubs = _STUB_CACHE[channel] = {}
+    
+    stub = stubs.get(stub_cls)
+    if stub is None:
+        stub = stubs[stub_cls] = stub_cls(channel)
+    return stub
+
+
+# Keepalive settings for long-lived channels, so idle connections are
+# probed instead of silently dropped and the next call doesn't reconnect.
+# Large paginated listings can exceed the 4 MB default receive limit
+_DEFAULT_CHANNEL_OPTIONS = (
+    ("grpc.keepalive_time_ms", 30000),
+    ("grpc.keepalive_timeout_ms", 10000),
+    ("grpc.http2.max_pings_without_data", 0),
+    ("grpc.keepalive_permit_without_calls", 1),
+    ("grpc.max_receive_message_length", 16 * 1024 * 1024),
+)
+
+# grpc.aio channels are bound to the event loop that created them and keep
+# a strong reference to it, so a WeakKeyDictionary keyed by loop would never
+# drop its entries. Plain dicts are used instead: channels of closed loops
+# are released on the next lookup, and close_default_channels() closes a
+# running loop's channels explicitly
+_AIO_CHANNELS: Dict[asyncio.AbstractEventLoop, Dict[Hashable, Any]] = {}
+
+
+def _loop_channels(cache: Dict[asyncio.AbstractEventLoop, Dict[Hashable, Any]]) -> Dict[Hashable, Any]:
+    """Get the running loop's channels from a per-loop cache."""
+    loop = asyncio.get_running_loop()
+    channels = cache.get(loop)
+    if channels is None:
+        for stale in [other for other in cache if other.is_closed()]:
+            del cache[stale]
+        channels = cache[loop] = {}
+    return channels
+
+
+async def _close_loop_channels(cache: Dict[asyncio.AbstractEventLoop, Dict[Hashable, Any]]):
+    """Close and forget the running loop's channels in a per-loop cache."""
+    channels = cache.pop(asyncio.get_running_loop(), None)
+    if channels:
+        for channel in channels.values():
+            _STUB_CACHE.pop(channel, None)
+        await asyncio.gather(*(channel.close() for channel in channels.values()))
+
+
+def _aio_channel(cache: Dict[asyncio.AbstractEventLoop, Dict[Hashable, Any]],
+                 target: str,
+                 options: Any = (),
+                 channel_credentials: Optional[Any] = None,
+                 insecure: bool = False):
+    """Get a cached grpc.aio channel for the running event loop (gzip by default)."""
+    channels = _loop_channels(cache)
+    key = (target, _freeze(options), channel_credentials, insecure)
+    
+    channel = channels.get(key)
+    if channel is None:
+        if insecure:
+            channel = grpc.aio.insecure_channel(
+                target, options=options, compression=grpc.Compression.Gzip
+            )
+        else:
+            credentials = channel_credentials or grpc.ssl_channel_credentials()
+            channel = grpc.aio.secure_channel(
+                target, credentials, options=options, compression=grpc.Compression.Gzip
+            )
+        channels[key] = channel
+    return channel
+
+
+def get_default_channel(target: str,
+                        credentials: Optional[Any] = None,
+                        insecure: bool = False):
+    """
+    Get the shared keepalive-tuned channel for a target.
+    
+    Repeated calls on the same event loop return the same channel, so every
+    query reuses one HTTP/2 connection instead of reconnecting.
+    
+    Args:
+        target: gRPC endpoint (e.g., "grpc.akash.network:9090")
+        credentials: Optional channel credentials (system TLS roots when None)
+        insecure: Use a plaintext channel
+        
+    Returns:
+        grpc.aio channel
+    """
+    return _aio_channel(_AIO_CHANNELS, target, _DEFAULT_CHANNEL_OPTIONS, credentials, insecure)
+
+
+async def close_default_channels() -> None:
+    """Close the channels get_default_channel() cached for the running event loop."""
+    await _close_loop_channels(_AIO_CHANNELS)
+
+
+class QueryAio:
+    """
+    Async counterpart of the generated experimental ``Query`` helpers.
+    
+    The generated ``Query.<Method>(request, target, ...)`` static methods use
+    the blocking ``grpc.experimental`` API. This shim accepts the same
+    arguments but awaits the call on a keepalive-tuned ``grpc.aio`` channel
+    cached by the shim per event loop and target, with gzip compression
+    unless the call passes another ``compression``. The shim owns its
+    channels; close it when done:
+    
+        async with QueryAio(deployment_grpc.QueryStub) as query:
+            response = await query.Deployments(request, "grpc.akash.network:9090")
+    """
+    
+    def __init__(self, stub_cls):
+        """
+        Initialize the shim.
+        
+        Args:
+            stub_cls: Generated stub class (e.g., deployment_grpc.QueryStub)
+        """
+        self._stub_cls = stub_cls
+        self._channels: Dict[asyncio.AbstractEventLoop, Dict[Hashable, Any]] = {}
+    
+    async def close(self):
+        """Close the channels this shim opened on the running event loop."""
+        await _close_loop_channels(self._channels)
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+    
+    def __getattr__(self, method: str):
+        if method.startswith("_"):
+            raise AttributeError(method)
+        stub_cls = self._stub_cls
+        cache = self._channels
+        
+        async def call(request,
+                       target: str,
+                       options: Any = (),
+                       channel_credentials: Optional[Any] = None,
+                       call_credentials: Optional[Any] = None,
+                       insecure: bool = False,
+                       compression: Optional[Any] = None,
+                       wait_for_ready: Optional[bool] = None,
+                       timeout: Optional[float] = None,
+                       metadata: Optional[Any] = None):
+            channel = _aio_channel(
+                cache, target, _DEFAULT_CHANNEL_OPTIONS + tuple(options), channel_credentials, insecure
+            )
+            multicallable = getattr(get_stub(channel, stub_cls), method)
+            return await multicallable(
+                request,
+                timeout=timeout,
+                metadata=metadata,
+                credentials=call_credentials,
+                wait_for_ready=wait_for_ready,
+                compression=compression
+            )
+        
+        call.__name__ = method
+        return call
+
+
+class ChannelPool:
+    """
+    Round-robin pool of gRPC channels to a single endpoint.
+    
+    A single HTTP/2 connection carries at most ~100 concurrent streams, so
+    spreading calls over several channels raises the number of RPCs that can
+    be in flight at once. Stubs are built once per channel and reused; the
+    classes passed as ``stub_classes`` are built up front.
+    """
+    
+    def __init__(self,
+                 target: str,
+                 size: int = 4,
+                 credentials: Optional[Any] = None,
+                 options: Optional[List[Any]] = None,
+                 compression: Optional[Any] = None,
+                 stub_classes: Tuple[Any, ...] = ()):
+        """
+        Initialize the channel pool.
+        
+        Args:
+            target: gRPC endpoint (e.g., "grpc.akash.network:9090")
+            size: Number of channels in the pool
+            credentials: Optional gRPC credentials for TLS
+            options: Additional gRPC channel options
+            compression: Default call compression (gzip when None;
+                pass grpc.Compression.NoCompression to disable)
+            stub_classes: Generated stub classes to build for every channel
+        """
+        if size < 1:
+            raise AkashGrpcClientError("Channel pool size must be at least 1")
+        
+        # A local subchannel pool keeps each channel on its own connection
+        channel_options = [("grpc.use_local_subchannel_pool", 1)]
+        channel_options += _DEFAULT_CHANNEL_OPTIONS
+        channel_options += list(options or [])
+        
+        # List responses carry many repeated attribute maps and compress well
+        if compression is None:
+            compression = grpc.Compression.Gzip
+        
+        # A distinct channel_id keeps gRPC core from merging channels whose
+        # arguments are otherwise identical onto one subchannel
+        if credentials:
+            self._channels = [
+                grpc.aio.secure_channel(
+                    target, credentials, options=channel_options + [("grpc.channel_id", i)],
+                    compression=compression
+                )
+                for i in range(size)
+            ]
+        else:
+            self._channels = [
+                grpc.aio.insecure_channel(
+                    target, options=channel_options + [("grpc.channel_id", i)],
+                    compression=compression
+                )
+                for i in range(size)
+            ]
+        
+        self._rr = itertools.cycle(range(size))
+        self._stubs: Dict[Any, List[Any]] = {
+            stub_cls: [get_stub(channel, stub_cls) for channel in self._channels]
+            for stub_cls in stub_classes
+        }
+    
+    @property
+    def size(self) -> int:
+        """Number of channels in the pool."""
+        return len(self._channels)
+    
+    def channel(self):
+        """Get the next channel in round-robin order."""
+        return self._channels[next(self._rr)]
+    
+    def stub(self, stub_cls):
+        """
+        Get a service stub bound to the next channel in round-robin order.
+        
+        Args:
+            stub_cls: Generated stub class (e.g., deployment_grpc.QueryStub)
+            
+        Returns:
+            Stub instance
+        """
+        try:
+            stubs = self._stubs[stub_cls]
+        except KeyError:
+            stubs = self._stubs[stub_cls] = [get_stub(channel, stub_cls) for channel in self._channels]
+        return stubs[next(self._rr)]
+    
+    async def channel_ready(self):
+        """Wait until every channel in the pool is connected."""
+        await asyncio.gather(*(channel.channel_ready() for channel in self._channels))
+    
+    async def close(self):
+        """Close every channel in the pool."""
+        await asyncio.gather(*(channel.close() for channel in self._channels))
+        for channel in self._channels:
+            _STUB_CACHE.pop(channel, None)
+        self._stubs.clear()
+
+
+# Channel pools shared by every client on the same event loop, keyed by
+# (endpoint, pool size, credentials, compression) -> [pool, reference count]
+_CHANNEL_CACHE: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Hashable, List[Any]]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _acquire_pool(key: Tuple[Any, ...]) -> ChannelPool:
+    """Get the shared channel pool for a key, creating it on first use."""
+    pools = _CHANNEL_CACHE.setdefault(asyncio.get_running_loop(), {})
+    entry = pools.get(key)
+    if entry is None:
+        target, size, credentials, compression = key
+        pool = ChannelPool(target, size, credentials, compression=compression, stub_classes=_QUERY_STUBS)
+        entry = pools[key] = [pool, 0]
+    entry[1] += 1
+    return entry[0]
+
+
+async def _release_pool(key: Tuple[Any, ...]):
+    """Drop one reference to a shared pool, closing it after the last one."""
+    pools = _CHANNEL_CACHE.get(asyncio.get_running_loop(), {})
+    entry = pools.get(key)
+    if entry is None:
+        return
+    entry[1] -= 1
+    if entry[1] <= 0:
+        del pools[key]
+        await entry[0].close()
 
 
 class AkashGrpcClient:
@@ -43,58 +509,163 @@ class AkashGrpcClient:
     for all Akash gRPC services.
     """
     
+    # Circuit breakers are shared by every client talking to an endpoint
+    _breakers: Dict[str, _BreakerState] = {}
+    
     def __init__(self, 
                  grpc_endpoint: str,
                  timeout: int = 30,
                  max_retries: int = 3,
-                 credentials: Optional[Any] = None):
+                 credentials: Optional[Any] = None,
+                 pool_size: int = 4,
+                 compression: Optional[Any] = None,
+                 cache_ttl: float = 3.0,
+                 cache_size: int = 512,
+                 breaker_threshold: int = 5,
+                 breaker_cooldown: float = 30.0):
         """
         Initialize the gRPC client.
         
         Args:
             grpc_endpoint: gRPC endpoint URL (e.g., "grpc.akash.network:9090")
             timeout: Request timeout in seconds
-            max_retries: Maximum number of retry attempts
+            max_retries: Maximum number of attempts per query (at least one is made)
             credentials: Optional gRPC credentials for TLS
+            pool_size: Number of channels used to spread concurrent calls
+            compression: Default call compression (gzip when None)
+            cache_ttl: Seconds to cache query results (0 disables caching)
+            cache_size: Maximum number of cached query results
+            breaker_threshold: Consecutive UNAVAILABLE/DEADLINE_EXCEEDED
+                failures that open the endpoint's circuit
+            breaker_cooldown: Seconds an open circuit rejects calls before
+                letting a trial call through
         """
         if not GRPC_AVAILABLE:
             raise AkashGrpcClientError("grpcio is required for gRPC support. Install with: pip install grpcio")
         
         if not PROTOBUF_AVAILABLE:
-            raise AkashGrpcClientError("Protobuf services not available. Run protobuf generation first.")
+            raise AkashGrpcClientError(
+                f"Generated protobuf services are not importable ({_PROTOBUF_IMPORT_ERROR}). "
+                "They need googleapis-common-protos and the cosmos / cosmos_proto "
+                "modules generated from the cosmos-sdk protos, which this package "
+                "does not ship; use the REST client instead"
+            )
+        _check_protobuf_backend()
         
         self.endpoint = grpc_endpoint
         self.timeout = timeout
         self.max_retries = max_retries
         self.credentials = credentials
-        self._channel = None
-        
-        # Service stubs (initialized lazily)
-        self._deployment_stub = None
-        self._market_stub = None
-        self._provider_stub = None
-        self._cert_stub = None
-    
-    @asynccontextmanager
-    async def _get_channel(self):
-        """Get or create a gRPC channel with proper cleanup."""
-        if self._channel is None:
-            if self.credentials:
-                self._channel = grpc.aio.secure_channel(self.endpoint, self.credentials)
-            else:
-                self._channel = grpc.aio.insecure_channel(self.endpoint)
+        self.pool_size = pool_size
+        self.compression = compression
+        self.breaker_threshold = breaker_threshold
+        self.breaker_cooldown = breaker_cooldown
+        self._pool = None
+        self._pool_lock: Optional[asyncio.Lock] = None
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        self._cache = _TTLCache(cache_ttl, cache_size) if cache_ttl > 0 else None
+    
+    @property
+    def _pool_key(self) -> Tuple[Any, ...]:
+        return (self.endpoint, self.pool_size, self.credentials, self.compression)
+    
+    async def _ensure_channel(self) -> ChannelPool:
+        """
+        Get the channel pool, acquiring it exactly once.
+        
+        Clients with the same endpoint, pool size, credentials and
+        compression share one pool (and its prebuilt query stubs) on each
+        event loop, so only the first of them pays for the handshakes.
+        """
+        pool = self._pool
+        if pool is not None:
+            return pool
+        
+        if self._pool_lock is None:
+            self._pool_lock = asyncio.Lock()
+        async with self._pool_lock:
+            if self._pool is None:
+                self._pool = _acquire_pool(self._pool_key)
+            return self._pool
+    
+    async def _retry_async(self, call):
+        """
+        Run an RPC with decorrelated-jitter retries behind a circuit breaker.
+        
+        Only UNAVAILABLE, RESOURCE_EXHAUSTED and DEADLINE_EXCEEDED are
+        retried; other codes fail immediately. After ``breaker_threshold``
+        consecutive UNAVAILABLE/DEADLINE_EXCEEDED failures the endpoint's
+        circuit opens and calls fail fast for ``breaker_cooldown`` seconds.
+        Then a single call probes the endpoint while the others keep failing
+        fast; its outcome closes the circuit or opens it again. At least one
+        attempt is made even when ``max_retries`` is below 1.
         
+        Args:
+            call: Zero-argument coroutine function performing one attempt
+            
+        Returns:
+            The RPC result
+            
+        Raises:
+            AkashGrpcTransientError: If the circuit is open or the call kept
+                failing with a transient code
+            AkashGrpcClientError: If the call fails with any other code
+        """
+        breaker = self._breakers.get(self.endpoint)
+        if breaker is None:
+            breaker = self._breakers[self.endpoint] = _BreakerState()
+        
+        trial = False
+        if breaker.opened_at is not None:
+            if breaker.trial or time.monotonic() - breaker.opened_at < self.breaker_cooldown:
+                raise AkashGrpcTransientError(f"Circuit open for {self.endpoint}")
+            # Half-open: this call alone probes the endpoint, with a single
+            # attempt; concurrent callers keep failing fast until it settles
+            breaker.trial = trial = True
+        
+        attempts = 1 if trial else max(1, self.max_retries)
+        delay = _RETRY_BASE
         try:
-            yield self._channel
-        except grpc.aio.AioRpcError as e:
-            logging.error(f"gRPC error: {e.code()}: {e.details()}")
-            raise AkashGrpcClientError(f"gRPC call failed: {e.details()}")
+            for attempt in range(1, attempts + 1):
+                try:
+                    result = await call()
+                except grpc.aio.AioRpcError as e:
+                    code = e.code()
+                    if code in _BREAKER_CODES:
+                        breaker.failures += 1
+                        if trial or breaker.failures >= self.breaker_threshold:
+                            breaker.opened_at = time.monotonic()
+                            raise _rpc_error(
+                                f"Circuit open for {self.endpoint}", code, e.details()
+                            ) from e
+                    elif trial:
+                        # The endpoint answered, so it is reachable again
+                        breaker.failures = 0
+                        breaker.opened_at = None
+                    if code not in _RETRYABLE_CODES or attempt == attempts:
+                        raise _rpc_error(
+                            f"Query failed after {attempt} attempts", code, e.details()
+                        ) from e
+                    delay = min(_RETRY_CAP, random.uniform(_RETRY_BASE, delay * 3))
+                    await asyncio.sleep(delay)
+                else:
+                    breaker.failures = 0
+                    breaker.opened_at = None
+                    return result
+        finally:
+            if trial:
+                breaker.trial = False
     
     async def close(self):
-        """Close the gRPC channel."""
-        if self._channel:
-            await self._channel.close()
-            self._channel = None
+        """Release the gRPC channel pool (closed once no client uses it)."""
+        if self._pool:
+            self._pool = None
+            await _release_pool(self._pool_key)
+    
+    def clear_cache(self):
+        """Drop all cached query results."""
+        if self._cache is not None:
+            self._cache.clear()
     
     async def __aenter__(self):
         """Async context manager entry."""
@@ -105,6 +676,8 @@ class AkashGrpcClient:
         await self.close()
     
     # Deployment service methods
+    @_coalesced
+    @_translate_grpc_errors
     async def query_deployments(self, 
                                owner: Optional[str] = None,
                                state: Optional[str] = None,
@@ -122,109 +695,141 @@ class AkashGrpcClient:
         Returns:
             Query response as dictionary
         """
-        async with self._get_channel() as channel:
-            if self._deployment_stub is None:
-                self._deployment_stub = deployment_grpc.QueryStub(channel)
-            
-            # Create query request (would need proper protobuf message construction)
-            # This is a placeholder - actual implementation would create proper protobuf messages
-            request = {
-                'owner': owner,
-                'state': state,
-                'pagination': {
-                    'key': pagination_key,
-                    'limit': pagination_limit
-                }
-            }
-            
-            # Make gRPC call with retry logic
-            for attempt in range(self.max_retries):
-                try:
-                    # This would be the actual gRPC call
-                    # response = await self._deployment_stub.QueryDeployments(request, timeout=self.timeout)
-                    # return response
-                    
-                    # Placeholder response
-                    return {"deployments": [], "pagination": {"next_key": None}}
-                    
-                except grpc.aio.AioRpcError as e:
-                    if attempt == self.max_retries - 1:
-                        raise AkashGrpcClientError(f"Query failed after {self.max_retries} attempts: {e.details()}")
-                    await asyncio.sleep(2 ** attempt)  # Exponential backoff
+        async def call():
+            # Placeholder implementation
+            return {"deployments": [], "pagination": {"next_key": None}}
+        
+        return await self._retry_async(call)
+    
+    async def _stream(self, open_call) -> AsyncGenerator[Any, None]:
+        """
+        Relay a server-streaming RPC, reconnecting while it is UNAVAILABLE.
+        
+        Messages are read with ``call.read()`` and yielded inline, so a slow
+        consumer applies backpressure to the stream instead of events being
+        buffered here. Reconnects back off with the same decorrelated
+        jitter as ``_retry_async``; the delay resets once a message arrives.
+        
+        Args:
+            open_call: Zero-argument function starting the streaming call
+        """
+        delay = _RETRY_BASE
+        while True:
+            call = open_call()
+            try:
+                while True:
+                    message = await call.read()
+                    if message is grpc.aio.EOF:
+                        return
+                    delay = _RETRY_BASE
+                    yield message
+            except grpc.aio.AioRpcError as e:
+                code = e.code()
+                if code != grpc.StatusCode.UNAVAILABLE:
+                    raise _rpc_error("Stream failed", code, e.details()) from e
+                delay = min(_RETRY_CAP, random.uniform(_RETRY_BASE, delay * 3))
+                await asyncio.sleep(delay)
+            finally:
+                call.cancel()
+    
+    @property
+    def supports_deployment_events(self) -> bool:
+        """
+        Whether ``stream_deployment_events`` can be used.
+        
+        True only when the generated deployment Query service defines the
+        StreamDeploymentEvents RPC. Otherwise events are available through
+        AkashAsyncClient.subscribe_deployment_events (Tendermint websocket).
+        """
+        return DEPLOYMENT_EVENTS_AVAILABLE
     
     async def stream_deployment_events(self, filters: Optional[Dict] = None) -> AsyncGenerator[Dict[str, Any], None]:
         """
-        Stream deployment events in real-time.
+        Stream deployment events in real-time over a server-streaming RPC.
+        
+        Only available when ``supports_deployment_events`` is True.
         
         Args:
-            filters: Optional filters for events
+            filters: Request fields, parsed into the RPC's request message
             
         Yields:
             Deployment events as they occur
-        """
-        async with self._get_channel() as channel:
-            if self._deployment_stub is None:
-                self._deployment_stub = deployment_grpc.QueryStub(channel)
             
-            # Placeholder for streaming implementation
-            # This would use gRPC streaming calls
-            for i in range(5):  # Placeholder
-                yield {"event": f"deployment_event_{i}", "timestamp": asyncio.get_event_loop().time()}
-                await asyncio.sleep(1)
+        Raises:
+            AkashGrpcClientError: If the deployment Query service has no
+                event stream (see ``supports_deployment_events``)
+        """
+        if not DEPLOYMENT_EVENTS_AVAILABLE:
+            raise AkashGrpcClientError(
+                "Deployment event streaming is not served over gRPC; "
+                "use AkashAsyncClient.subscribe_deployment_events"
+            )
+        
+        method = deployment_pb2.DESCRIPTOR.services_by_name["Query"].methods_by_name["StreamDeploymentEvents"]
+        request = ParseDict(filters or {}, message_factory.GetMessageClass(method.input_type)())
+        
+        pool = await self._ensure_channel()
+        stream = pool.stub(deployment_grpc.QueryStub).StreamDeploymentEvents
+        async for event in self._stream(lambda: stream(request, timeout=None)):
+            yield MessageToDict(event, preserving_proto_field_name=True)
     
     # Market service methods  
+    @_coalesced
+    @_translate_grpc_errors
     async def query_bids(self, 
                         owner: Optional[str] = None,
                         provider: Optional[str] = None,
                         state: Optional[str] = None) -> Dict[str, Any]:
         """Query bids using gRPC."""
-        async with self._get_channel() as channel:
-            if self._market_stub is None:
-                self._market_stub = market_grpc.QueryStub(channel)
-            
+        async def call():
             # Placeholder implementation
             return {"bids": [], "pagination": {"next_key": None}}
+        
+        return await self._retry_async(call)
     
+    @_coalesced
+    @_translate_grpc_errors
     async def query_leases(self, 
                           owner: Optional[str] = None,
                           provider: Optional[str] = None,
                           state: Optional[str] = None) -> Dict[str, Any]:
         """Query leases using gRPC."""
-        async with self._get_channel() as channel:
-            if self._market_stub is None:
-                self._market_stub = market_grpc.QueryStub(channel)
-            
+        async def call():
             # Placeholder implementation
             return {"leases": [], "pagination": {"next_key": None}}
+        
+        return await self._retry_async(call)
     
     # Provider service methods
+    @_coalesced
+    @_translate_grpc_errors
     async def query_providers(self, filters: Optional[Dict] = None) -> Dict[str, Any]:
         """Query providers using gRPC."""
-        async with self._get_channel() as channel:
-            if self._provider_stub is None:
-                self._provider_stub = provider_grpc.QueryStub(channel)
-            
+        async def call():
             # Placeholder implementation
             return {"providers": [], "pagination": {"next_key": None}}
+        
+        return await self._retry_async(call)
     
     # Certificate service methods
+    @_coalesced
+    @_translate_grpc_errors
     async def query_certificates(self, owner: Optional[str] = None) -> Dict[str, Any]:
         """Query certificates using gRPC."""
-        async with self._get_channel() as channel:
-            if self._cert_stub is None:
-                self._cert_stub = cert_grpc.QueryStub(channel)
-            
+        async def call():
             # Placeholder implementation
             return {"certificates": [], "pagination": {"next_key": None}}
+        
+        return await self._retry_async(call)
     
     # Health check
     async def health_check(self) -> bool:
         """Check if the gRPC endpoint is healthy."""
         try:
-            async with self._get_channel() as channel:
-                # Try a simple call to check connectivity
-                await channel.channel_ready()
-                return True
+            pool = await self._ensure_channel()
+            # Try a simple call to check connectivity
+            await pool.channel_ready()
+            return True
         except Exception:
             return False
 
@@ -236,19 +841,35 @@ def create_grpc_client(grpc_endpoint: str, **kwargs) -> AkashGrpcClient:
 
 
 class SyncGrpcWrapper:
-    """Synchronous wrapper for the async gRPC client."""
+    """
+    Synchronous wrapper for the async gRPC client.
+    
+    Every call runs on the same event loop, so the channel pool stays warm
+    between calls. On Python 3.11+ that loop belongs to an asyncio.Runner;
+    on older versions it runs in a background thread. Neither touches the
+    calling thread's current event loop.
+    """
     
     def __init__(self, grpc_endpoint: str, **kwargs):
         self.client = AkashGrpcClient(grpc_endpoint, **kwargs)
-        self.loop = None
+        self._runner = None
+        self._loop = None
+        self._thread = None
     
     def _run_async(self, coro):
         """Run an async coroutine in sync context."""
-        if self.loop is None:
-            self.loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(self.loop)
+        if sys.version_info >= (3, 11):
+            if self._runner is None:
+                self._runner = asyncio.Runner()
+            return self._runner.run(coro)
         
-        return self.loop.run_until_complete(coro)
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+            self._thread = threading.Thread(
+                target=self._loop.run_forever, name="akash-grpc-sync", daemon=True
+            )
+            self._thread.start()
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
     
     def query_deployments(self, **kwargs):
         """Sync wrapper for query_deployments."""
@@ -272,7 +893,13 @@ class SyncGrpcWrapper:
     
     def close(self):
         """Close the client and event loop."""
-        if self.loop:
-            self._run_async(self.client.close())
-            self.loop.close()
-            self.loop = None
+        if self._runner is not None:
+            self._runner.run(self.client.close())
+            self._runner.close()
+            self._runner = None
+        elif self._loop is not None:
+            asyncio.run_coroutine_threadsafe(self.client.close(), self._loop).result()
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._loop.close()
+            self._loop = self._thread = None
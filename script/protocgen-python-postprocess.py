@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Post-process grpc_tools.protoc output for the akash_api Python package.
+
+Every generated ``*_pb2_grpc.py`` module inlines the same grpcio version
+check, which imports ``grpc._utilities`` and compares versions on import.
+This script replaces that block with a call to
+``akash_api._grpc_version.ensure`` so the comparison runs once per process,
+and drops the ``import warnings`` line that is left unused.
+
+The rewrite is idempotent; running it on already processed files is a no-op.
+
+Usage:
+    protocgen-python-postprocess.py <package-dir> [<package-dir> ...]
+"""
+
+import pathlib
+import re
+import sys
+
+_WARNINGS_IMPORT = re.compile(r"^import warnings\n", re.MULTILINE)
+
+_VERSION_CHECK = re.compile(
+    r"^_version_not_supported = False\n"
+    r"\n"
+    r"try:\n"
+    r"    from grpc\._utilities import first_version_is_lower\n"
+    r"    _version_not_supported = first_version_is_lower\(GRPC_VERSION, GRPC_GENERATED_VERSION\)\n"
+    r"except ImportError:\n"
+    r"    _version_not_supported = True\n"
+    r"\n"
+    r"if _version_not_supported:\n"
+    r"    raise RuntimeError\(\n"
+    r"        f'The grpc package installed is at version \{GRPC_VERSION\},'\n"
+    r"        \+ f' but the generated code in (?P<module>\S+) depends on'\n"
+    r"(?:        \+ f'.*\n)*"
+    r"    \)\n",
+    re.MULTILINE,
+)
+
+_ENSURE = (
+    "\n"
+    "from akash_api._grpc_version import ensure as _ensure_grpc_version\n"
+    "_ensure_grpc_version(GRPC_GENERATED_VERSION, '{module}')\n"
+)
+
+
+def process(source: str) -> str:
+    """Return ``source`` with the inline version check replaced."""
+    source = _VERSION_CHECK.sub(
+        lambda match: _ENSURE.format(module=match.group("module")), source
+    )
+    if "warnings." not in source:
+        source = _WARNINGS_IMPORT.sub("", source, count=1)
+    return source
+
+
+def main(argv: list) -> int:
+    if not argv:
+        print(__doc__.strip().splitlines()[-1].strip(), file=sys.stderr)
+        return 2
+
+    changed = 0
+    for root in argv:
+        for path in sorted(pathlib.Path(root).rglob("*_pb2_grpc.py")):
+            original = path.read_text()
+            updated = process(original)
+            if updated != original:
+                path.write_text(updated)
+                changed += 1
+
+    print(f"Post-processed {changed} gRPC module(s).")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -68,6 +68,9 @@ if [ -d "$PYTHON_OUT_DIR/akash" ]; then
     
     # Create __init__.py files in all subdirectories
     find "$PYTHON_PKG_DIR/akash" -type d -exec touch {}/__init__.py \;
-    
+
+    # Replace the per-module grpcio version check with the shared one
+    $PYTHON_CMD "$AKASH_ROOT/script/protocgen-python-postprocess.py" "$PYTHON_PKG_DIR/akash"
+
     echo "Python package updated successfully."
 fi